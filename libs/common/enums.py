@@ -47,3 +47,26 @@ class ComparisonModeEnum(Enum):
     def list(cls) -> List[str]:
         """Return all comparison modes as a list of strings"""
         return [mode.value for mode in cls]
+
+
+class ImageFileFormatEnum(Enum):
+    """On-disk formats for captured images (value is the file extension)."""
+    JPEG = "jpg"  # Lossy, smallest files
+    WEBP = "webp"  # Lossless WebP - full fidelity, cheaper to encode than PNG
+    NPY = "npy"  # Raw NumPy array - no encode at all, header + buffer copy
+
+    @classmethod
+    def list(cls) -> List[str]:
+        """Return all image file formats as a list of strings"""
+        return [image_format.value for image_format in cls]
+
+
+class ImageBlurMethodEnum(Enum):
+    """Smoothing filter applied before thresholding in object detection."""
+    BILATERAL = "bilateral"  # Edge-preserving, O(d^2) per pixel - original behavior
+    GAUSSIAN = "gaussian"  # Separable, several times faster; adequate ahead of adaptive threshold
+
+    @classmethod
+    def list(cls) -> List[str]:
+        """Return all blur methods as a list of strings"""
+        return [blur_method.value for blur_method in cls]
@@ -4,10 +4,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
+import pgvector
 from common.constants import TABLE_WALNUT_IMAGE
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from pgvector.sqlalchemy import VECTOR
+from sqlalchemy import BigInteger, DateTime, Dialect, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base__db_dao import Base
 
@@ -15,6 +16,44 @@ if TYPE_CHECKING:
     from .walnut_image__db_dao import WalnutImageDBDAO
 
 
+class Float32Vector(VECTOR):
+    """
+    pgvector column type that exchanges embeddings as float32 numpy arrays.
+
+    Relies on the binary vector codec registered on each asyncpg connection by SessionFactory: results
+    arrive as pgvector Vector objects and are exposed as float32 ndarrays viewing the decoded buffer,
+    and binds are sent as Vector objects, so no per-element text or Python list conversion happens.
+    """
+
+    cache_ok = True
+    # Render "$n::VECTOR(dim)" so asyncpg picks the binary vector codec even inside multi-row VALUES
+    render_bind_cast = True
+
+    def bind_processor(self, dialect: Dialect) -> Any:
+        def process(value: Any) -> Optional[pgvector.Vector]:
+            if value is None or isinstance(value, pgvector.Vector):
+                return value
+            return pgvector.Vector(value)
+
+        return process
+
+    def result_processor(self, dialect: Dialect, coltype: Any) -> Any:
+        def process(value: Any) -> Optional[np.ndarray]:
+            if value is None:
+                return None
+            if isinstance(value, pgvector.Vector):
+                return value.to_numpy()
+            if isinstance(value, np.ndarray):
+                # pgvector 0.4.x's asyncpg codec decodes straight to an ndarray
+                return np.asarray(value, dtype=np.float32)
+            if isinstance(value, str):
+                # Text format '[0.1,0.2,...]' (connection without the binary codec)
+                return np.fromstring(value[1:-1], sep=",", dtype=np.float32)
+            raise TypeError(f"Unexpected vector result type: {type(value).__name__}")
+
+        return process
+
+
 class WalnutImageEmbeddingDBDAO(Base):
     """Data Access Object / ORM model for the walnut_image_embedding table."""
 
@@ -25,9 +64,9 @@ class WalnutImageEmbeddingDBDAO(Base):
         BigInteger, ForeignKey(f"{TABLE_WALNUT_IMAGE}.id", ondelete="CASCADE"), nullable=False
     )
     model_name: Mapped[str] = mapped_column(String, nullable=False)
-    embedding: Mapped[Any] = mapped_column(
-        Vector(2048), nullable=False
-    )  # pgvector Vector type (ResNet50 produces 2048-dim embeddings)
+    embedding: Mapped[np.ndarray] = mapped_column(
+        Float32Vector(2048), nullable=False
+    )  # pgvector vector(2048) exposed as a float32 ndarray (ResNet50 produces 2048-dim embeddings)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default="NOW()")
     created_by: Mapped[str] = mapped_column(String, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default="NOW()")
@@ -43,6 +82,19 @@ class WalnutImageEmbeddingDBDAO(Base):
             del kwargs["image_id"]
         super().__init__(**kwargs)
 
+    @validates("embedding")
+    def _validate_embedding(self, key: str, value: Any) -> Any:
+        """
+        Normalize embeddings to C-contiguous float32 arrays when they are assigned.
+
+        This is the one ingress point for vectors headed to the database (constructor kwargs and later
+        assignments alike), so the binary codec and the similarity math always get a flat float32 buffer.
+        Producers should already hand over contiguous float32 arrays, making this a no-op check.
+        """
+        if isinstance(value, np.ndarray) and (value.dtype != np.float32 or not value.flags.c_contiguous):
+            return np.ascontiguousarray(value, dtype=np.float32)
+        return value
+
     # Relationships
     # Using string literal - SQLAlchemy resolves it by class name at runtime
     image: Mapped["WalnutImageDBDAO"] = relationship("WalnutImageDBDAO", back_populates="embedding")
@@ -2,16 +2,27 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ..data_access_objects import WalnutDBDAO
+from ..data_access_objects import WalnutDBDAO, WalnutImageDBDAO
 
 if TYPE_CHECKING:
     from .walnut_image__db_reader import IWalnutImageDBReader
 
 
+# Shared statement for loading walnuts with their images and embeddings.
+# Built once at import time so every read reuses the same construct (and its SQLAlchemy cache key).
+_SELECT_WALNUT_WITH_IMAGES = select(WalnutDBDAO).options(
+    selectinload(WalnutDBDAO.images).selectinload(WalnutImageDBDAO.embedding)
+)
+# Primary-key lookup prebuilt with a named bind parameter: each call only supplies the id
+_SELECT_WALNUT_WITH_IMAGES_BY_ID = _SELECT_WALNUT_WITH_IMAGES.where(
+    WalnutDBDAO.id == bindparam("walnut_id")
+)
+
+
 class IWalnutDBReader(ABC):
     """Interface for reading walnut data from the database."""
 
@@ -55,45 +66,14 @@ class WalnutDBReader(IWalnutDBReader):
 
     async def get_by_id_async(self, walnut_id: str) -> Optional[WalnutDBDAO]:
         """Get a walnut by its ID with related images and embeddings loaded."""
-        from ..data_access_objects.walnut_image__db_dao import WalnutImageDBDAO
-        
-        result = await self.session.execute(
-            select(WalnutDBDAO)
-            .options(
-                selectinload(WalnutDBDAO.images).selectinload(WalnutImageDBDAO.embedding)
-            )
-            .where(WalnutDBDAO.id == walnut_id)
-        )
-        walnut = result.scalar_one_or_none()
-        
-        if walnut is not None:
-            # Explicitly access relationships to ensure they're loaded while in async context
-            _ = walnut.images
-            for image in walnut.images:
-                _ = image.embedding
-        
-        return walnut
+        # selectinload populates images and embeddings eagerly, no per-row touch needed
+        result = await self.session.execute(_SELECT_WALNUT_WITH_IMAGES_BY_ID, {"walnut_id": walnut_id})
+        return result.scalar_one_or_none()
 
     async def get_all_async(self) -> List[WalnutDBDAO]:
         """Get all walnuts from the database with related images and embeddings loaded."""
-        from ..data_access_objects.walnut_image__db_dao import WalnutImageDBDAO
-        
-        result = await self.session.execute(
-            select(WalnutDBDAO)
-            .options(
-                selectinload(WalnutDBDAO.images).selectinload(WalnutImageDBDAO.embedding)
-            )
-            .order_by(WalnutDBDAO.created_at.desc())
-        )
-        walnuts = result.scalars().all()
-
-        # Explicitly access relationships to ensure they're loaded while in async context
-        for walnut in walnuts:
-            _ = walnut.images
-            for image in walnut.images:
-                _ = image.embedding
-
-        return list(walnuts)
+        result = await self.session.execute(_SELECT_WALNUT_WITH_IMAGES.order_by(WalnutDBDAO.created_at.desc()))
+        return list(result.scalars().all())
 
     async def get_by_id_with_images_async(self, walnut_id: str) -> Optional[WalnutDBDAO]:
         """Get a walnut by ID with its related images and embeddings loaded.
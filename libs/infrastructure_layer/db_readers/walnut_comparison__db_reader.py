@@ -3,12 +3,23 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..data_access_objects.walnut_comparison__db_dao import WalnutComparisonDBDAO
 
 
+# 2.0-style base statement built once at import; lookups only add their WHERE/ORDER BY,
+# so each call reuses the compiled-SQL cache entry instead of rebuilding the construct.
+_SELECT_WALNUT_COMPARISON = select(WalnutComparisonDBDAO)
+
+# Pair lookup prebuilt with named bind parameters: calls only supply values, nothing is constructed per call
+_SELECT_WALNUT_COMPARISON_BY_IDS = _SELECT_WALNUT_COMPARISON.where(
+    WalnutComparisonDBDAO.walnut_id == bindparam("walnut_id"),
+    WalnutComparisonDBDAO.compared_walnut_id == bindparam("compared_walnut_id"),
+).limit(1)
+
+
 class IWalnutComparisonDBReader(ABC):
     """Interface for reading walnut comparison data from database."""
 
@@ -43,15 +54,14 @@ class WalnutComparisonDBReader(IWalnutComparisonDBReader):
     async def get_all_async(self) -> List[WalnutComparisonDBDAO]:
         """Get all walnut comparisons from the database."""
         result = await self.session.execute(
-            select(WalnutComparisonDBDAO).order_by(WalnutComparisonDBDAO.final_similarity.desc())
+            _SELECT_WALNUT_COMPARISON.order_by(WalnutComparisonDBDAO.final_similarity.desc())
         )
         return list(result.scalars().all())
 
     async def get_by_walnut_id_async(self, walnut_id: str) -> List[WalnutComparisonDBDAO]:
         """Get all comparisons for a specific walnut."""
         result = await self.session.execute(
-            select(WalnutComparisonDBDAO)
-            .where(
+            _SELECT_WALNUT_COMPARISON.where(
                 (WalnutComparisonDBDAO.walnut_id == walnut_id) | 
                 (WalnutComparisonDBDAO.compared_walnut_id == walnut_id)
             )
@@ -62,12 +72,7 @@ class WalnutComparisonDBReader(IWalnutComparisonDBReader):
     async def get_by_ids_async(self, walnut_id: str, compared_walnut_id: str) -> Optional[WalnutComparisonDBDAO]:
         """Get a specific comparison between two walnuts."""
         result = await self.session.execute(
-            select(WalnutComparisonDBDAO)
-            .where(
-                (WalnutComparisonDBDAO.walnut_id == walnut_id) &
-                (WalnutComparisonDBDAO.compared_walnut_id == compared_walnut_id)
-            )
-            .limit(1)
+            _SELECT_WALNUT_COMPARISON_BY_IDS, {"walnut_id": walnut_id, "compared_walnut_id": compared_walnut_id}
         )
         return result.scalar_one_or_none()
 
@@ -1,15 +1,29 @@
 # infrastructure_layer/db_readers/walnut_image__db_reader.py
 """Database reader for walnut images."""
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from ..data_access_objects import WalnutImageDBDAO
 
-if TYPE_CHECKING:
-    from .walnut_image_embedding__db_reader import IWalnutImageEmbeddingDBReader
+
+# Shared base statement so every image lookup emits identical column lists and SQL text,
+# letting the asyncpg prepared-statement cache hit across calls.
+_SELECT_WALNUT_IMAGE = select(WalnutImageDBDAO)
+# Same, with the one-to-one embedding fetched in the same round trip through a LEFT OUTER JOIN
+_SELECT_WALNUT_IMAGE_WITH_EMBEDDING = _SELECT_WALNUT_IMAGE.options(
+    joinedload(WalnutImageDBDAO.embedding)
+)
+# Primary-key lookups prebuilt with a named bind parameter: each call only supplies the id
+_SELECT_WALNUT_IMAGE_BY_ID = _SELECT_WALNUT_IMAGE.where(
+    WalnutImageDBDAO.id == bindparam("image_id")
+)
+_SELECT_WALNUT_IMAGE_WITH_EMBEDDING_BY_ID = _SELECT_WALNUT_IMAGE_WITH_EMBEDDING.where(
+    WalnutImageDBDAO.id == bindparam("image_id")
+)
 
 
 class IWalnutImageDBReader(ABC):
@@ -39,56 +53,37 @@ class IWalnutImageDBReader(ABC):
 class WalnutImageDBReader(IWalnutImageDBReader):
     """Implementation of IWalnutImageDBReader for reading walnut image data from PostgreSQL."""
 
-    def __init__(
-        self,
-        session: AsyncSession,
-        embedding_reader: "IWalnutImageEmbeddingDBReader",
-    ) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         """
-        Initialize the reader with an async session and embedding reader.
+        Initialize the reader with an async session.
 
         Args:
             session: AsyncSession instance (injected via DI container)
-            embedding_reader: IWalnutImageEmbeddingDBReader instance (injected via DI container).
         """
         self.session: AsyncSession = session
-        self.embedding_reader: "IWalnutImageEmbeddingDBReader" = embedding_reader
 
     async def get_by_id_async(self, image_id: int) -> Optional[WalnutImageDBDAO]:
         """Get a walnut image by its ID without embedding."""
-        result = await self.session.execute(
-            select(WalnutImageDBDAO).where(WalnutImageDBDAO.id == image_id)
-        )
+        result = await self.session.execute(_SELECT_WALNUT_IMAGE_BY_ID, {"image_id": image_id})
         return result.scalar_one_or_none()
 
     async def get_by_walnut_id_async(self, walnut_id: str) -> List[WalnutImageDBDAO]:
         """Get all images for a specific walnut without embeddings."""
         result = await self.session.execute(
-            select(WalnutImageDBDAO)
-            .where(WalnutImageDBDAO.walnut_id == walnut_id)
+            _SELECT_WALNUT_IMAGE.where(WalnutImageDBDAO.walnut_id == walnut_id)
             .order_by(WalnutImageDBDAO.side)
         )
         return list(result.scalars().all())
 
     async def get_by_walnut_id_with_embeddings_async(self, walnut_id: str) -> List[WalnutImageDBDAO]:
         """Get all images for a specific walnut with their embeddings loaded."""
-        images = await self.get_by_walnut_id_async(walnut_id)
-
-        # Load embeddings for each image
-        for image in images:
-            if image.id is not None:
-                image.embedding = await self.embedding_reader.get_by_image_id_async(image.id)
-
-        return images
+        result = await self.session.execute(
+            _SELECT_WALNUT_IMAGE_WITH_EMBEDDING.where(WalnutImageDBDAO.walnut_id == walnut_id)
+            .order_by(WalnutImageDBDAO.side)
+        )
+        return list(result.scalars().all())
 
     async def get_by_id_with_embedding_async(self, image_id: int) -> Optional[WalnutImageDBDAO]:
         """Get a walnut image by ID with its embedding loaded."""
-        image = await self.get_by_id_async(image_id)
-        if image is None:
-            return None
-
-        # Load embedding
-        if image.id is not None:
-            image.embedding = await self.embedding_reader.get_by_image_id_async(image.id)
-
-        return image
+        result = await self.session.execute(_SELECT_WALNUT_IMAGE_WITH_EMBEDDING_BY_ID, {"image_id": image_id})
+        return result.scalar_one_or_none()
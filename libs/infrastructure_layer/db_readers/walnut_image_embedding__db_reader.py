@@ -2,8 +2,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-import numpy as np
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure_layer.data_access_objects.walnut_image_embedding__db_dao import (
@@ -11,6 +10,18 @@ from infrastructure_layer.data_access_objects.walnut_image_embedding__db_dao imp
 )
 
 
+# 2.0-style base statement built once at import; lookups only add their WHERE/ORDER BY,
+# so each call reuses the compiled-SQL cache entry instead of rebuilding the construct.
+_SELECT_WALNUT_IMAGE_EMBEDDING = select(WalnutImageEmbeddingDBDAO)
+# Key lookups prebuilt with named bind parameters: each call only supplies the id
+_SELECT_WALNUT_IMAGE_EMBEDDING_BY_ID = _SELECT_WALNUT_IMAGE_EMBEDDING.where(
+    WalnutImageEmbeddingDBDAO.id == bindparam("embedding_id")
+)
+_SELECT_WALNUT_IMAGE_EMBEDDING_BY_IMAGE_ID = _SELECT_WALNUT_IMAGE_EMBEDDING.where(
+    WalnutImageEmbeddingDBDAO.image_id == bindparam("image_id")
+).limit(1)
+
+
 class IWalnutImageEmbeddingDBReader(ABC):
     """Interface for reading walnut image embedding data from the database."""
 
@@ -42,76 +53,20 @@ class WalnutImageEmbeddingDBReader(IWalnutImageEmbeddingDBReader):
         """
         self.session: AsyncSession = session
 
-    def _vector_to_numpy(self, vector_data) -> np.ndarray:
-        """
-        Convert PostgreSQL vector type to numpy array.
-
-        Args:
-            vector_data: Vector data from PostgreSQL (could be string, list, or array)
-
-        Returns:
-            numpy.ndarray: The embedding as a numpy array
-        """
-        if isinstance(vector_data, str):
-            # If it's a string like '[0.1, 0.2, ...]', parse it
-            import ast
-
-            vector_list = ast.literal_eval(vector_data)
-            return np.array(vector_list, dtype=np.float32)
-        elif isinstance(vector_data, (list, tuple)):
-            return np.array(vector_data, dtype=np.float32)
-        elif isinstance(vector_data, np.ndarray):
-            return vector_data.astype(np.float32)
-        else:
-            # Try to convert directly
-            return np.array(vector_data, dtype=np.float32)
-
     async def get_by_id_async(self, embedding_id: int) -> Optional[WalnutImageEmbeddingDBDAO]:
         """Get an embedding by its ID."""
-        result = await self.session.execute(
-            select(WalnutImageEmbeddingDBDAO).where(WalnutImageEmbeddingDBDAO.id == embedding_id)
-        )
-        embedding = result.scalar_one_or_none()
-        
-        if embedding is None:
-            return None
-
-        # Convert embedding vector to numpy if needed
-        if embedding.embedding is not None and not isinstance(embedding.embedding, np.ndarray):
-            embedding.embedding = self._vector_to_numpy(embedding.embedding)
-
-        return embedding
+        result = await self.session.execute(_SELECT_WALNUT_IMAGE_EMBEDDING_BY_ID, {"embedding_id": embedding_id})
+        return result.scalar_one_or_none()
 
     async def get_by_image_id_async(self, image_id: int) -> Optional[WalnutImageEmbeddingDBDAO]:
         """Get an embedding by image ID (one-to-one relationship)."""
-        result = await self.session.execute(
-            select(WalnutImageEmbeddingDBDAO)
-            .where(WalnutImageEmbeddingDBDAO.image_id == image_id)
-            .limit(1)
-        )
-        embedding = result.scalar_one_or_none()
-        
-        if embedding is None:
-            return None
-
-        # Convert embedding vector to numpy if needed
-        if embedding.embedding is not None and not isinstance(embedding.embedding, np.ndarray):
-            embedding.embedding = self._vector_to_numpy(embedding.embedding)
-
-        return embedding
+        result = await self.session.execute(_SELECT_WALNUT_IMAGE_EMBEDDING_BY_IMAGE_ID, {"image_id": image_id})
+        return result.scalar_one_or_none()
 
     async def get_by_model_name_async(self, model_name: str) -> List[WalnutImageEmbeddingDBDAO]:
         """Get all embeddings for a specific model."""
         result = await self.session.execute(
-            select(WalnutImageEmbeddingDBDAO)
-            .where(WalnutImageEmbeddingDBDAO.model_name == model_name)
+            _SELECT_WALNUT_IMAGE_EMBEDDING.where(WalnutImageEmbeddingDBDAO.model_name == model_name)
             .order_by(WalnutImageEmbeddingDBDAO.created_at.desc())
         )
-        embeddings = result.scalars().all()
-        
-        # Convert embedding vectors to numpy if needed
-        for embedding in embeddings:
-            if embedding.embedding is not None and not isinstance(embedding.embedding, np.ndarray):
-                embedding.embedding = self._vector_to_numpy(embedding.embedding)
-
-        return list(embeddings)
+        return list(result.scalars().all())
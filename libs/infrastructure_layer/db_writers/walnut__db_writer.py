@@ -1,14 +1,31 @@
 # infrastructure_layer/db_writers/walnut__db_writer.py
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from infrastructure_layer.data_access_objects import WalnutDBDAO
+from infrastructure_layer.data_access_objects import WalnutDBDAO, WalnutImageDBDAO
+from sqlalchemy import TextClause, delete, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
     from .walnut_image__db_writer import IWalnutImageDBWriter
 
 
+# Columns supplied by the bulk insert path (timestamps are generated by the database)
+_WALNUT_INSERT_FIELDS: Tuple[str, ...] = (
+    "id",
+    "description",
+    "width_mm",
+    "height_mm",
+    "thickness_mm",
+    "created_by",
+    "updated_by",
+)
+
+# Bulk loads are re-runnable, so they trade commit durability for latency: the COMMIT returns without waiting
+# for the WAL flush. SET LOCAL scopes this to the current transaction only.
+_SET_LOCAL_ASYNC_COMMIT: TextClause = text("SET LOCAL synchronous_commit = OFF")
+
+
 class IWalnutDBWriter(ABC):
     """Interface for writing walnut data to the database."""
 
@@ -22,6 +39,16 @@ class IWalnutDBWriter(ABC):
         """Save a walnut with all its images and embeddings. Returns walnut with IDs."""
         pass
 
+    @abstractmethod
+    async def bulk_save_async(self, walnuts: List[WalnutDBDAO]) -> List[WalnutDBDAO]:
+        """Save many new walnuts (cascading to their images and embeddings) in one transaction. Returns walnuts with IDs."""
+        pass
+
+    @abstractmethod
+    async def bulk_save_with_images_async(self, walnuts: List[WalnutDBDAO]) -> List[WalnutDBDAO]:
+        """Insert many new walnuts with their images and embeddings in one transaction. Returns walnuts with IDs."""
+        pass
+
     @abstractmethod
     async def save_or_update_async(self, walnut: WalnutDBDAO) -> WalnutDBDAO:
         """Save or update a walnut. Returns walnut with timestamps."""
@@ -39,10 +66,15 @@ class WalnutDBWriter(IWalnutDBWriter):
         """
         Initialize the writer with an async SQLAlchemy session and image writer.
 
+        The session is expected to come from SessionFactory (pooled engine, expire_on_commit=False); the
+        write paths commit and return the same instances without refreshing them.
+
         Args:
             session: AsyncSession instance (injected via DI container)
             image_writer: IWalnutImageDBWriter instance (injected via DI container)
         """
+        if session.sync_session.expire_on_commit:
+            raise ValueError("WalnutDBWriter requires a session created with expire_on_commit=False")
         self.session: AsyncSession = session
         self.image_writer: "IWalnutImageDBWriter" = image_writer
 
@@ -63,21 +95,16 @@ class WalnutDBWriter(IWalnutDBWriter):
         If it doesn't exist, it will be inserted.
         """
         try:
-            walnut_id = getattr(walnut, "id", None)
-            if walnut_id is None or walnut_id == "":
+            # The walnut id is application-assigned, so it is always set on the instance
+            walnut_id = walnut.id
+            if not walnut_id:
                 # New object - use add() which will cascade to images and embeddings
                 self.session.add(walnut)
             else:
-                # Check if walnut exists
-                existing = await self.session.get(WalnutDBDAO, walnut_id)
-                if existing is not None:
-                    # Update existing walnut - merge will update the walnut and handle related objects
-                    # First, delete existing images and embeddings (they will be recreated)
-                    for image in existing.images:
-                        if hasattr(image, "embedding") and image.embedding:
-                            self.session.delete(image.embedding)
-                        self.session.delete(image)
-                    await self.session.flush()  # Flush the deletes
+                # Delete any existing images in one statement (they will be recreated); their embeddings go
+                # with them through the ON DELETE CASCADE foreign key. For a walnut that doesn't exist yet this
+                # matches no rows, so no separate existence check (or hydration of the walnut) is needed.
+                await self.session.execute(delete(WalnutImageDBDAO).where(WalnutImageDBDAO.walnut_id == walnut_id))
 
                 # Merge the walnut (will update if exists, insert if new)
                 # This will also add/update the images and embeddings
@@ -90,6 +117,58 @@ class WalnutDBWriter(IWalnutDBWriter):
             await self.session.rollback()
             raise
 
+    async def bulk_save_async(self, walnuts: List[WalnutDBDAO]) -> List[WalnutDBDAO]:
+        """
+        Save many new walnuts (cascading to their images and embeddings) in one transaction.
+
+        All walnuts are added to the session and written by a single flush, then committed once with
+        synchronous_commit turned off for that transaction. Returns walnuts with IDs.
+        """
+        if not walnuts:
+            return walnuts
+
+        try:
+            await self.session.execute(_SET_LOCAL_ASYNC_COMMIT)
+            self.session.add_all(walnuts)
+            await self.session.flush()  # One flush for the whole batch
+            await self.session.commit()
+            return walnuts
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    async def bulk_save_with_images_async(self, walnuts: List[WalnutDBDAO]) -> List[WalnutDBDAO]:
+        """
+        Insert many new walnuts with their images and embeddings in one transaction.
+
+        Uses three executemany INSERTs (walnuts, then images and embeddings through the image writer's bulk path)
+        instead of the ORM unit-of-work cascade. Relationship cascades are not exercised: foreign keys are stitched
+        manually and the generated IDs are written back onto the given DAOs. Walnuts must not exist yet.
+        """
+        if not walnuts:
+            return walnuts
+
+        try:
+            walnut_rows: List[Dict[str, Any]] = [
+                {field: getattr(walnut, field) for field in _WALNUT_INSERT_FIELDS} for walnut in walnuts
+            ]
+            images: List[WalnutImageDBDAO] = []
+            for walnut in walnuts:
+                for image in walnut.images:
+                    image.walnut_id = walnut.id
+                    images.append(image)
+
+            await self.session.execute(_SET_LOCAL_ASYNC_COMMIT)
+            await self.session.execute(insert(WalnutDBDAO), walnut_rows)
+            # model_name=None keeps the model name already stamped on each embedding
+            await self.image_writer.bulk_save_with_embedding_async(images, model_name=None)
+
+            await self.session.commit()  # Commit once for the whole batch
+            return walnuts
+        except Exception:
+            await self.session.rollback()
+            raise
+
     async def save_or_update_async(self, walnut: WalnutDBDAO) -> WalnutDBDAO:
         """Save or update a walnut. Returns walnut with timestamps."""
         # The save_async method already handles upsert with merge
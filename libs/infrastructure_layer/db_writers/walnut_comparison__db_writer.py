@@ -1,13 +1,64 @@
 # infrastructure_layer/db_writers/walnut_comparison__db_writer.py
 from abc import ABC, abstractmethod
-from typing import List
+from operator import attrgetter
+from typing import Any, Dict, List, Tuple
 
-from sqlalchemy import select
+from asyncpg.exceptions import UniqueViolationError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningInsert
 
 from infrastructure_layer.data_access_objects.walnut_comparison__db_dao import WalnutComparisonDBDAO
 
 
+# Columns copied from an incoming comparison onto an existing row during upsert
+_UPDATE_FIELDS: Tuple[str, ...] = (
+    "width_diff_mm",
+    "height_diff_mm",
+    "thickness_diff_mm",
+    "basic_similarity",
+    "width_weight",
+    "height_weight",
+    "thickness_weight",
+    "front_embedding_score",
+    "back_embedding_score",
+    "left_embedding_score",
+    "right_embedding_score",
+    "top_embedding_score",
+    "down_embedding_score",
+    "advanced_similarity",
+    "final_similarity",
+    "updated_by",
+)
+
+# Columns supplied on insert (id and timestamps are generated by the database)
+_INSERT_FIELDS: Tuple[str, ...] = ("walnut_id", "compared_walnut_id", "created_by") + _UPDATE_FIELDS
+
+# Reads every insert column in one C-level call instead of a Python-level getattr per field
+_get_insert_values = attrgetter(*_INSERT_FIELDS)
+
+
+def _build_upsert_statement() -> ReturningInsert[WalnutComparisonDBDAO]:
+    """Build the INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement shared by the upsert paths."""
+    stmt = pg_insert(WalnutComparisonDBDAO)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[WalnutComparisonDBDAO.walnut_id, WalnutComparisonDBDAO.compared_walnut_id],
+        set_={field: stmt.excluded[field] for field in _UPDATE_FIELDS},
+    )
+    # populate_existing overwrites any stale instances already held in the session's identity map. RETURNING order
+    # isn't requested (sort_by_parameter_order): SQLAlchemy would sort by the generated id, which an updated row
+    # keeps from its original insert, so callers match the returned rows back by pair instead.
+    return stmt.returning(WalnutComparisonDBDAO).execution_options(populate_existing=True)
+
+
+_UPSERT_COMPARISON = _build_upsert_statement()
+
+
+def _to_row(comparison_dao: WalnutComparisonDBDAO) -> Dict[str, Any]:
+    """Extract the insertable column values of a comparison DAO."""
+    return dict(zip(_INSERT_FIELDS, _get_insert_values(comparison_dao)))
+
+
 class IWalnutComparisonDBWriter(ABC):
     """Interface for writing walnut comparisons to database."""
 
@@ -26,6 +77,11 @@ class IWalnutComparisonDBWriter(ABC):
         """Bulk save or update walnut comparisons (upsert operation)."""
         pass
 
+    @abstractmethod
+    async def bulk_copy_insert_async(self, comparison_daos: List[WalnutComparisonDBDAO]) -> int:
+        """Bulk insert new walnut comparisons via COPY. Returns number of rows written."""
+        pass
+
 
 class WalnutComparisonDBWriter(IWalnutComparisonDBWriter):
     """Implementation for writing walnut comparisons to database."""
@@ -33,104 +89,87 @@ class WalnutComparisonDBWriter(IWalnutComparisonDBWriter):
     def __init__(self, session: AsyncSession) -> None:
         """
         Initialize with an async SQLAlchemy session.
-        
+
+        The session must not expire instances on commit: bulk_save_or_update_async returns the rows loaded
+        by RETURNING after committing, and reading expired attributes would need an implicit (sync) refresh.
+
         Args:
             session: AsyncSession instance (injected via DI container)
         """
+        if session.sync_session.expire_on_commit:
+            raise ValueError("WalnutComparisonDBWriter requires a session created with expire_on_commit=False")
         self.session: AsyncSession = session
 
     async def save_async(self, comparison_dao: WalnutComparisonDBDAO) -> WalnutComparisonDBDAO:
         """Save a new walnut comparison to the database."""
         self.session.add(comparison_dao)
-        await self.session.commit()
-        await self.session.refresh(comparison_dao)
+        await self.session.flush()  # Flush to get the generated ID and timestamps without committing
         return comparison_dao
 
     async def save_or_update_async(self, comparison_dao: WalnutComparisonDBDAO) -> WalnutComparisonDBDAO:
         """Save or update a walnut comparison (upsert operation)."""
-        # Try to find existing comparison
-        result = await self.session.execute(
-            select(WalnutComparisonDBDAO)
-            .where(
-                WalnutComparisonDBDAO.walnut_id == comparison_dao.walnut_id,
-                WalnutComparisonDBDAO.compared_walnut_id == comparison_dao.compared_walnut_id,
-            )
-        )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Update existing
-            existing.width_diff_mm = comparison_dao.width_diff_mm
-            existing.height_diff_mm = comparison_dao.height_diff_mm
-            existing.thickness_diff_mm = comparison_dao.thickness_diff_mm
-            existing.basic_similarity = comparison_dao.basic_similarity
-            existing.width_weight = comparison_dao.width_weight
-            existing.height_weight = comparison_dao.height_weight
-            existing.thickness_weight = comparison_dao.thickness_weight
-            existing.front_embedding_score = comparison_dao.front_embedding_score
-            existing.back_embedding_score = comparison_dao.back_embedding_score
-            existing.left_embedding_score = comparison_dao.left_embedding_score
-            existing.right_embedding_score = comparison_dao.right_embedding_score
-            existing.top_embedding_score = comparison_dao.top_embedding_score
-            existing.down_embedding_score = comparison_dao.down_embedding_score
-            existing.advanced_similarity = comparison_dao.advanced_similarity
-            existing.final_similarity = comparison_dao.final_similarity
-            existing.updated_by = comparison_dao.updated_by
-            await self.session.commit()
-            await self.session.refresh(existing)
-            return existing
-        else:
-            # Insert new
-            self.session.add(comparison_dao)
-            await self.session.commit()
-            await self.session.refresh(comparison_dao)
-            return comparison_dao
+        # Native upsert with RETURNING: one round trip, no lookup SELECT and no post-commit refresh
+        result = await self.session.scalars(_UPSERT_COMPARISON, [_to_row(comparison_dao)])
+        return result.one()
 
     async def bulk_save_or_update_async(self, comparison_daos: List[WalnutComparisonDBDAO]) -> List[WalnutComparisonDBDAO]:
         """Bulk save or update walnut comparisons (upsert operation)."""
-        saved_comparisons: List[WalnutComparisonDBDAO] = []
-
-        for comparison_dao in comparison_daos:
-            # Try to find existing comparison
-            result = await self.session.execute(
-                select(WalnutComparisonDBDAO)
-                .where(
-                    WalnutComparisonDBDAO.walnut_id == comparison_dao.walnut_id,
-                    WalnutComparisonDBDAO.compared_walnut_id == comparison_dao.compared_walnut_id,
-                )
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                # Update existing
-                existing.width_diff_mm = comparison_dao.width_diff_mm
-                existing.height_diff_mm = comparison_dao.height_diff_mm
-                existing.thickness_diff_mm = comparison_dao.thickness_diff_mm
-                existing.basic_similarity = comparison_dao.basic_similarity
-                existing.width_weight = comparison_dao.width_weight
-                existing.height_weight = comparison_dao.height_weight
-                existing.thickness_weight = comparison_dao.thickness_weight
-                existing.front_embedding_score = comparison_dao.front_embedding_score
-                existing.back_embedding_score = comparison_dao.back_embedding_score
-                existing.left_embedding_score = comparison_dao.left_embedding_score
-                existing.right_embedding_score = comparison_dao.right_embedding_score
-                existing.top_embedding_score = comparison_dao.top_embedding_score
-                existing.down_embedding_score = comparison_dao.down_embedding_score
-                existing.advanced_similarity = comparison_dao.advanced_similarity
-                existing.final_similarity = comparison_dao.final_similarity
-                existing.updated_by = comparison_dao.updated_by
-                saved_comparisons.append(existing)
-            else:
-                # Insert new
-                self.session.add(comparison_dao)
-                saved_comparisons.append(comparison_dao)
-
-        # Commit all changes at once
+        if not comparison_daos:
+            # An empty executemany would degrade into a single INSERT ... DEFAULT VALUES
+            return []
+
+        # One row per pair, the last occurrence winning: a single ON CONFLICT DO UPDATE statement can't touch
+        # the same row twice
+        rows_by_pair: Dict[Tuple[str, str], Dict[str, Any]] = {
+            (comparison_dao.walnut_id, comparison_dao.compared_walnut_id): _to_row(comparison_dao)
+            for comparison_dao in comparison_daos
+        }
+
+        # Single native upsert: PostgreSQL resolves insert vs update server-side (ON CONFLICT DO UPDATE)
+        # and RETURNING hands back the stored rows, so no per-pair SELECT or refresh is needed
+        result = await self.session.scalars(_UPSERT_COMPARISON, list(rows_by_pair.values()))
+        saved_by_pair: Dict[Tuple[str, str], WalnutComparisonDBDAO] = {
+            (saved.walnut_id, saved.compared_walnut_id): saved for saved in result.all()
+        }
+        # Back in input order (a duplicated pair maps to its one stored row)
+        saved_comparisons = [
+            saved_by_pair[(comparison_dao.walnut_id, comparison_dao.compared_walnut_id)] for comparison_dao in comparison_daos
+        ]
+
         await self.session.commit()
+        return saved_comparisons
 
-        # Refresh all saved comparisons
-        for comparison in saved_comparisons:
-            await self.session.refresh(comparison)
+    async def bulk_copy_insert_async(self, comparison_daos: List[WalnutComparisonDBDAO]) -> int:
+        """
+        Bulk insert new walnut comparisons via COPY. Returns number of rows written.
 
-        return saved_comparisons
+        Fast path for large batches of fresh comparisons: rows are streamed with COPY FROM STDIN on the
+        session's asyncpg connection, skipping per-statement parse/plan and ORM overhead. The DAOs are not
+        populated with ids or timestamps. If any pair already exists, the COPY is rolled back to a savepoint
+        and the whole batch goes through the upsert path instead.
+        """
+        if not comparison_daos:
+            return 0
+
+        try:
+            try:
+                async with self.session.begin_nested():
+                    # Acquiring the connection inside the nested transaction is what emits the SAVEPOINT
+                    connection = await self.session.connection()
+                    raw_connection = await connection.get_raw_connection()
+                    asyncpg_connection = raw_connection.driver_connection
+                    assert asyncpg_connection is not None  # Set for every live pooled asyncpg connection
+                    await asyncpg_connection.copy_records_to_table(
+                        WalnutComparisonDBDAO.__tablename__,
+                        records=[_get_insert_values(comparison_dao) for comparison_dao in comparison_daos],
+                        columns=_INSERT_FIELDS,
+                    )
+            except UniqueViolationError:
+                # Some pairs already exist - let ON CONFLICT DO UPDATE sort them out (commits on its own)
+                return len(await self.bulk_save_or_update_async(comparison_daos))
 
+            await self.session.commit()
+            return len(comparison_daos)
+        except Exception:
+            await self.session.rollback()
+            raise
@@ -1,15 +1,36 @@
 # infrastructure_layer/db_writers/walnut_image__db_writer.py
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from common.constants import DEFAULT_EMBEDDING_MODEL
-from infrastructure_layer.data_access_objects import WalnutImageDBDAO
+from infrastructure_layer.data_access_objects import WalnutImageDBDAO, WalnutImageEmbeddingDBDAO
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
     from .walnut_image_embedding__db_writer import IWalnutImageEmbeddingDBWriter
 
 
+# Columns copied from an incoming image onto the stored row in save_or_update_async
+_UPDATE_FIELDS: Tuple[str, ...] = ("image_path", "width", "height", "checksum", "updated_by")
+
+# Columns supplied by the bulk insert path (ids and timestamps are generated by the database)
+_IMAGE_INSERT_FIELDS: Tuple[str, ...] = (
+    "walnut_id",
+    "side",
+    "image_path",
+    "width",
+    "height",
+    "checksum",
+    "walnut_width_px",
+    "walnut_height_px",
+    "camera_distance_mm",
+    "focal_length_px",
+    "created_by",
+    "updated_by",
+)
+
+
 class IWalnutImageDBWriter(ABC):
     """Interface for writing walnut image data to the database."""
 
@@ -28,6 +49,13 @@ class IWalnutImageDBWriter(ABC):
         """Save an image with its embedding. Returns image with IDs."""
         pass
 
+    @abstractmethod
+    async def bulk_save_with_embedding_async(
+        self, images: List[WalnutImageDBDAO], model_name: Optional[str] = DEFAULT_EMBEDDING_MODEL
+    ) -> List[WalnutImageDBDAO]:
+        """Insert many new images with their embeddings. Returns images with IDs."""
+        pass
+
 
 class WalnutImageDBWriter(IWalnutImageDBWriter):
     """Implementation for writing walnut image data using SQLAlchemy async ORM."""
@@ -68,41 +96,78 @@ class WalnutImageDBWriter(IWalnutImageDBWriter):
     async def save_or_update_async(self, image: WalnutImageDBDAO) -> WalnutImageDBDAO:
         """Save or update an image. Returns image with ID."""
         if image.id is not None:
-            # Update existing - fetch from database
+            # Update existing - session.get() answers from the identity map when the row is already loaded
             existing = await self.session.get(WalnutImageDBDAO, image.id)
             if existing is None:
                 raise ValueError(f"Image with id {image.id} not found")
 
-            # Update fields
-            existing.image_path = image.image_path
-            existing.width = image.width
-            existing.height = image.height
-            existing.checksum = image.checksum
-            existing.updated_by = image.updated_by
+            # Update fields, skipping no-op assignments through the instrumented attributes
+            changed = False
+            for field in _UPDATE_FIELDS:
+                value = getattr(image, field)
+                if getattr(existing, field) != value:
+                    setattr(existing, field, value)
+                    changed = True
             # updated_at is set by database default
 
-            await self.session.flush()
+            # Nothing dirtied - skip the flush (and its UPDATE round trip) entirely
+            if changed:
+                await self.session.flush()
             return existing
         else:
             # Insert new
             return await self.save_async(image)
 
     async def save_with_embedding_async(self, image: WalnutImageDBDAO, model_name: str = DEFAULT_EMBEDDING_MODEL) -> WalnutImageDBDAO:
-        """Save an image with its embedding. Returns image with IDs."""
+        """
+        Save an image with its embedding. Returns image with IDs.
+
+        The embedding rides along on the image's save-update cascade, so both INSERTs go out in a single
+        flush with image_id filled in by the unit of work. Committing is left to the caller's transaction.
+        """
         try:
-            # Save image first
-            image = await self.save_async(image)
+            if image.embedding is not None:
+                if image.embedding.embedding is None:
+                    raise ValueError("Embedding cannot be None")
+                image.embedding.model_name = model_name
+            return await self.save_async(image)
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    async def bulk_save_with_embedding_async(
+        self, images: List[WalnutImageDBDAO], model_name: Optional[str] = DEFAULT_EMBEDDING_MODEL
+    ) -> List[WalnutImageDBDAO]:
+        """
+        Insert many new images with their embeddings. Returns images with IDs.
 
-            # Save embedding if present
-            if image.embedding is not None and image.id is not None:
+        Issues one executemany INSERT ... RETURNING id for the images and hands the embeddings to the embedding
+        writer's batched save_many_async, stitching image_id from the returned keys and writing the generated ids back onto the given DAOs. Pass
+        model_name=None to keep each embedding's own model name. Committing is left to the caller.
+        """
+        if not images:
+            return images
+
+        try:
+            image_rows: List[Dict[str, Any]] = [{field: getattr(image, field) for field in _IMAGE_INSERT_FIELDS} for image in images]
+            result = await self.session.execute(
+                insert(WalnutImageDBDAO).returning(WalnutImageDBDAO.id, sort_by_parameter_order=True), image_rows
+            )
+
+            embeddings: List[WalnutImageEmbeddingDBDAO] = []
+            for image, image_id in zip(images, result.scalars().all()):
+                image.id = image_id
                 embedding = image.embedding
-                embedding.image_id = image.id
-                embedding.model_name = model_name
-                saved_embedding = await self.embedding_writer.save_async(embedding)
-                image.embedding = saved_embedding
+                if embedding is not None:
+                    embedding.image_id = image_id
+                    if model_name is not None:
+                        embedding.model_name = model_name
+                    embeddings.append(embedding)
 
-            await self.session.commit()  # Commit the transaction
-            return image
+            if embeddings:
+                await self.embedding_writer.save_many_async(embeddings)
+
+            return images
         except Exception:
             await self.session.rollback()
             raise
@@ -1,10 +1,18 @@
 # infrastructure_layer/db_writers/walnut_image_embedding__db_writer.py
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, List, Tuple
 
-import numpy as np
 from infrastructure_layer.data_access_objects import WalnutImageEmbeddingDBDAO
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Columns supplied by the batched insert path (id and timestamps are generated by the database)
+_INSERT_FIELDS: Tuple[str, ...] = ("image_id", "model_name", "embedding", "created_by", "updated_by")
+
+# Rows per INSERT ... RETURNING statement; a 2048-dim vector makes each row ~8 KiB on the wire
+SAVE_MANY_CHUNK_SIZE = 500
+
 
 class IWalnutImageEmbeddingDBWriter(ABC):
     """Interface for writing walnut image embedding data to the database."""
@@ -19,6 +27,16 @@ class IWalnutImageEmbeddingDBWriter(ABC):
         """Save or update an embedding. Returns embedding with ID."""
         pass
 
+    @abstractmethod
+    async def save_many_async(self, embeddings: List[WalnutImageEmbeddingDBDAO]) -> List[WalnutImageEmbeddingDBDAO]:
+        """Save many new embeddings with batched inserts. Returns embeddings with generated IDs."""
+        pass
+
+    @abstractmethod
+    def batch(self) -> AsyncContextManager[None]:
+        """Group several save_async calls into one transaction, flushed once when the block exits."""
+        pass
+
 
 class WalnutImageEmbeddingDBWriter(IWalnutImageEmbeddingDBWriter):
     """Implementation for writing walnut image embedding data using SQLAlchemy async ORM."""
@@ -31,6 +49,7 @@ class WalnutImageEmbeddingDBWriter(IWalnutImageEmbeddingDBWriter):
             session: AsyncSession instance (injected via DI container)
         """
         self.session: AsyncSession = session
+        self._batch_active: bool = False
 
     async def save_async(self, embedding: WalnutImageEmbeddingDBDAO) -> WalnutImageEmbeddingDBDAO:
         """Save an embedding to the database. Returns embedding with generated ID."""
@@ -38,12 +57,12 @@ class WalnutImageEmbeddingDBWriter(IWalnutImageEmbeddingDBWriter):
             raise ValueError("Embedding cannot be None")
 
         try:
-            # Convert numpy array to list for pgvector
-            if isinstance(embedding.embedding, np.ndarray):
-                embedding.embedding = embedding.embedding.tolist()
-
-            # Add to session and flush to get generated ID
+            # Add to session and flush to get generated ID. numpy arrays are bound as-is: pgvector copies their
+            # float32 buffer in one go instead of boxing every element through tolist()
             self.session.add(embedding)
+            if self._batch_active:
+                # Inside batch(): the pending rows are flushed together (and get their IDs) when the block exits
+                return embedding
             await self.session.flush()  # Flush to get the generated ID without committing
             return embedding
         except Exception:
@@ -54,22 +73,20 @@ class WalnutImageEmbeddingDBWriter(IWalnutImageEmbeddingDBWriter):
         """Save or update an embedding. Returns embedding with ID."""
         try:
             if embedding.id is not None:
-                # Update existing - fetch from database
-                existing = await self.session.get(WalnutImageEmbeddingDBDAO, embedding.id)
-                if existing is None:
-                    raise ValueError(f"Embedding with id {embedding.id} not found")
-
-                # Update fields
-                existing.model_name = embedding.model_name
+                # Update existing in one round-trip: UPDATE ... RETURNING instead of a SELECT followed by a flush
+                values: Dict[str, Any] = {"model_name": embedding.model_name, "updated_by": embedding.updated_by}
                 if embedding.embedding is not None:
-                    if isinstance(embedding.embedding, np.ndarray):
-                        existing.embedding = embedding.embedding.tolist()
-                    else:
-                        existing.embedding = embedding.embedding
-                existing.updated_by = embedding.updated_by
+                    values["embedding"] = embedding.embedding
                 # updated_at is set by database default
-
-                await self.session.flush()
+                result = await self.session.execute(
+                    update(WalnutImageEmbeddingDBDAO)
+                    .where(WalnutImageEmbeddingDBDAO.id == embedding.id)
+                    .values(values)
+                    .returning(WalnutImageEmbeddingDBDAO)
+                )
+                existing = result.scalar_one_or_none()
+                if existing is None:
+                    raise ValueError(f"Embedding with id {embedding.id} not found")
                 return existing
             else:
                 # Insert new
@@ -77,3 +94,62 @@ class WalnutImageEmbeddingDBWriter(IWalnutImageEmbeddingDBWriter):
         except Exception:
             await self.session.rollback()
             raise
+
+    async def save_many_async(self, embeddings: List[WalnutImageEmbeddingDBDAO]) -> List[WalnutImageEmbeddingDBDAO]:
+        """
+        Save many new embeddings with batched inserts. Returns embeddings with generated IDs.
+
+        Each chunk of SAVE_MANY_CHUNK_SIZE rows is written by one executemany INSERT ... RETURNING id from plain
+        dicts (no unit-of-work flush); the ids are written back onto the given DAOs, which stay outside the session
+        (adding them would cascade their still-transient images into the next flush). Committing is left to the caller.
+        """
+        if not embeddings:
+            return embeddings
+
+        try:
+            for embedding in embeddings:
+                if embedding.embedding is None:
+                    raise ValueError("Embedding cannot be None")
+
+            stmt = insert(WalnutImageEmbeddingDBDAO).returning(WalnutImageEmbeddingDBDAO.id, sort_by_parameter_order=True)
+            for start in range(0, len(embeddings), SAVE_MANY_CHUNK_SIZE):
+                chunk = embeddings[start : start + SAVE_MANY_CHUNK_SIZE]
+                rows: List[Dict[str, Any]] = [
+                    {field: getattr(embedding, field) for field in _INSERT_FIELDS} for embedding in chunk
+                ]
+                result = await self.session.execute(stmt, rows)
+                for embedding, embedding_id in zip(chunk, result.scalars().all()):
+                    embedding.id = embedding_id
+            return embeddings
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Group several save_async calls into one transaction.
+
+        Inside the block save_async only adds to the session; the pending embeddings are flushed as one batched
+        INSERT ... RETURNING when the block exits, which is when their IDs become available. If the session has no
+        transaction yet, the block runs in session.begin() and commits (or rolls back) on exit; otherwise the block
+        joins the caller's transaction and only flushes, leaving the commit to the caller.
+        """
+        if self._batch_active:
+            # Nested batch: the outermost block flushes
+            yield
+            return
+
+        self._batch_active = True
+        try:
+            if self.session.in_transaction():
+                yield
+                await self.session.flush()
+            else:
+                async with self.session.begin():
+                    yield
+        except Exception:
+            await self.session.rollback()
+            raise
+        finally:
+            self._batch_active = False
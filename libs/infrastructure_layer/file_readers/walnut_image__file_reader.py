@@ -1,15 +1,63 @@
 # infrastructure_layer/file_readers/walnut_image__file_reader.py
 """File reader to load walnut images from filesystem and create file DAOs."""
-import hashlib
+import os
+import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from blake3 import blake3
 from common.enums import WalnutSideEnum
 from common.logger import get_logger
 from infrastructure_layer.data_access_objects.walnut__file_dao import WalnutFileDAO, WalnutImageFileDAO
 from PIL import Image
 
+# BLAKE3 checksums are tagged so they stay distinguishable from legacy unprefixed MD5 hex digests
+# (rows written before the switch; see scripts/backfill_image_checksums.py)
+BLAKE3_CHECKSUM_PREFIX = "b3:"
+
+# JPEG start-of-frame markers (SOF0-SOF15 minus DHT 0xC4, JPG 0xC8 and DAC 0xCC); their payload carries the size
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers that stand alone without a length field (TEM, RST0-RST7)
+_JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xD8)) | {0x01}
+
+# Mapping from side enum to file name letter
+_SIDE_TO_LETTER = {
+    WalnutSideEnum.FRONT: "F",
+    WalnutSideEnum.BACK: "B",
+    WalnutSideEnum.LEFT: "L",
+    WalnutSideEnum.RIGHT: "R",
+    WalnutSideEnum.TOP: "T",
+    WalnutSideEnum.DOWN: "D",
+}
+
+# Image file names: {walnut_id}_{SIDE_LETTER}[_{anything}].jpg (side letter in either case), capturing
+# the walnut id and the side letter
+_SIDE_LETTER_CLASS = "".join(_SIDE_TO_LETTER.values())
+_IMAGE_FILE_NAME_PATTERN = re.compile(rf"^([^_]+)_([{_SIDE_LETTER_CLASS}{_SIDE_LETTER_CLASS.lower()}])(?:_.*)?\.jpg$")
+
+# Upper bound on threads loading image files (stat, header parse and hash per file)
+MAX_LOAD_WORKERS = 8
+
+# Files up to this size are read once into memory and hashed/parsed from that buffer; larger ones are streamed
+SINGLE_PASS_MAX_FILE_SIZE = 64 * 1024 * 1024
+# Prefix read to find the frame header of a streamed (oversized) file; APPn segments are capped at 64 KiB each
+JPEG_HEADER_READ_SIZE = 256 * 1024
+
+
+def calculate_file_checksum(file_path: Path) -> str:
+    """
+    Calculate the stored checksum of an image file: "b3:<hex>".
+
+    BLAKE3 (SIMD) over a memory map of the file. The same algorithm is used on every machine, so a file
+    always gets the same checksum. Hashing is single-threaded: image files are small, and the directory
+    loader already hashes several files in parallel.
+    """
+    hasher = blake3()
+    hasher.update_mmap(file_path)
+    return f"{BLAKE3_CHECKSUM_PREFIX}{hasher.hexdigest()}"
+
 
 class IWalnutImageFileReader(ABC):
     """Interface for reading walnut image data from filesystem."""
@@ -28,19 +76,25 @@ class IWalnutImageFileReader(ABC):
         """
         pass
 
+    @abstractmethod
+    def load_all_from_directory(self, image_directory: Path) -> Dict[str, WalnutFileDAO]:
+        """
+        Load the images of every walnut found in a directory, grouped by walnut ID.
+
+        Args:
+            image_directory: Path to the directory containing images
+
+        Returns:
+            Mapping of walnut ID to its WalnutFileDAO (empty if the directory doesn't exist or has no images)
+        """
+        pass
+
 
 class WalnutImageFileReader(IWalnutImageFileReader):
     """Loads walnut images from filesystem and creates file DAOs."""
 
     # Mapping from side enum to file name letter
-    SIDE_TO_LETTER = {
-        WalnutSideEnum.FRONT: "F",
-        WalnutSideEnum.BACK: "B",
-        WalnutSideEnum.LEFT: "L",
-        WalnutSideEnum.RIGHT: "R",
-        WalnutSideEnum.TOP: "T",
-        WalnutSideEnum.DOWN: "D",
-    }
+    SIDE_TO_LETTER = _SIDE_TO_LETTER
 
     LETTER_TO_SIDE = {v: k for k, v in SIDE_TO_LETTER.items()}
 
@@ -49,13 +103,46 @@ class WalnutImageFileReader(IWalnutImageFileReader):
         self.logger = get_logger(__name__)
 
     @staticmethod
-    def _calculate_checksum(file_path: Path) -> str:
-        """Calculate MD5 checksum of a file."""
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+    def _checksum_bytes(data: bytes) -> str:
+        """Checksum an in-memory file, in the same format as calculate_file_checksum."""
+        return f"{BLAKE3_CHECKSUM_PREFIX}{blake3(data).hexdigest()}"
+
+    @staticmethod
+    def _parse_jpeg_dimensions(data: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Parse (width, height) from a JPEG's start-of-frame segment without decoding the image.
+
+        Walks the marker segments from the start of the buffer, jumping over each one by its length field,
+        so only the header bytes up to the SOF are touched. Returns None if the data isn't a well-formed
+        JPEG (no SOI, or scan data / end of buffer reached before any SOF).
+        """
+        if data[:2] != b"\xff\xd8":
+            return None
+        size = len(data)
+        pos = 2
+        while pos < size:
+            if data[pos] != 0xFF:
+                return None
+            # Any number of 0xFF fill bytes may precede the marker code
+            while pos < size and data[pos] == 0xFF:
+                pos += 1
+            if pos >= size:
+                return None
+            marker = data[pos]
+            pos += 1
+            if marker in _JPEG_STANDALONE_MARKERS:
+                continue
+            if marker in (0xD9, 0xDA):  # EOI / SOS - no frame header before the image data
+                return None
+            if marker in _JPEG_SOF_MARKERS:
+                # length (2), precision (1), height (2), width (2)
+                if pos + 7 > size:
+                    return None
+                return int.from_bytes(data[pos + 5 : pos + 7], "big"), int.from_bytes(data[pos + 3 : pos + 5], "big")
+            if pos + 2 > size:
+                return None
+            pos += int.from_bytes(data[pos : pos + 2], "big")
+        return None
 
     def _parse_filename(self, file_path: Path) -> Optional[str]:
         """
@@ -63,12 +150,100 @@ class WalnutImageFileReader(IWalnutImageFileReader):
         Expected format: {walnut_id}_{SIDE_LETTER}_{number}.jpg
         Example: 0001_F_1.jpg -> "F"
         """
-        parts = file_path.stem.split("_")
-        if len(parts) >= 2:
-            letter = parts[1].upper()
-            if letter in self.LETTER_TO_SIDE:
-                return letter
-        return None
+        match = _IMAGE_FILE_NAME_PATTERN.match(file_path.name)
+        return match.group(2).upper() if match is not None else None
+
+    def _scan_image_files(
+        self, image_directory: Path, walnut_id: Optional[str] = None
+    ) -> Optional[Dict[str, List[Tuple[Path, str]]]]:
+        """
+        Scan a directory once and group its image files by walnut ID.
+
+        Returns a mapping of walnut ID to (file path, side letter) pairs, restricted to walnut_id when given,
+        or None if the directory can't be read (missing, or not a directory).
+        """
+        files_by_walnut: Dict[str, List[Tuple[Path, str]]] = {}
+        try:
+            with os.scandir(image_directory) as entries:
+                for entry in entries:
+                    match = _IMAGE_FILE_NAME_PATTERN.match(entry.name)
+                    if match is None:
+                        continue
+                    entry_walnut_id, side_letter = match.groups()
+                    if walnut_id is not None and entry_walnut_id != walnut_id:
+                        continue
+                    if entry.is_file():
+                        files_by_walnut.setdefault(entry_walnut_id, []).append((Path(entry.path), side_letter.upper()))
+        except OSError:
+            return None
+        return files_by_walnut
+
+    def _load_grouped_images(
+        self, image_directory: Path, files_by_walnut: Dict[str, List[Tuple[Path, str]]]
+    ) -> Dict[str, WalnutFileDAO]:
+        """Load grouped image files on one thread pool and build a WalnutFileDAO per walnut with any readable image."""
+        walnut_ids: List[str] = []
+        file_paths: List[Path] = []
+        side_letters: List[str] = []
+        for walnut_id, files in files_by_walnut.items():
+            for file_path, side_letter in files:
+                walnut_ids.append(walnut_id)
+                file_paths.append(file_path)
+                side_letters.append(side_letter)
+        if not file_paths:
+            return {}
+
+        # Each file is stat'ed, parsed and hashed on a worker thread (file reads and hashing release the GIL)
+        images_by_walnut: Dict[str, List[WalnutImageFileDAO]] = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(file_paths))) as executor:
+            for walnut_id, image_dao in zip(walnut_ids, executor.map(self._load_image, file_paths, side_letters)):
+                if image_dao is not None:
+                    images_by_walnut.setdefault(walnut_id, []).append(image_dao)
+
+        return {
+            walnut_id: WalnutFileDAO(walnut_id=walnut_id, image_directory=image_directory, images=images)
+            for walnut_id, images in images_by_walnut.items()
+        }
+
+    def _load_image(self, file_path: Path, side_letter: str) -> Optional[WalnutImageFileDAO]:
+        """Load one image file into a file DAO. Returns None if the file can't be read."""
+        try:
+            # One open for stat, dimensions and checksum
+            with open(file_path, "rb", buffering=0) as f:
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size <= SINGLE_PASS_MAX_FILE_SIZE:
+                    # Read the file once; the frame-header parse and the hash both work on that buffer
+                    data = f.readall()
+                    dimensions = self._parse_jpeg_dimensions(data)
+                    checksum: Optional[str] = self._checksum_bytes(data)
+                else:
+                    dimensions = self._parse_jpeg_dimensions(f.read(JPEG_HEADER_READ_SIZE))
+                    checksum = None
+
+            if checksum is None:
+                checksum = calculate_file_checksum(file_path)
+
+            # Fall back to PIL for anything the marker walk can't parse
+            if dimensions is None:
+                with Image.open(file_path) as img:
+                    dimensions = img.size
+            width, height = dimensions
+
+            return WalnutImageFileDAO(
+                file_path=file_path,
+                side_letter=side_letter,
+                width=width,
+                height=height,
+                file_size=file_size,
+                checksum=checksum,
+            )
+        except Exception as e:
+            self.logger.warning(
+                "image_load_error",
+                file_path=str(file_path),
+                error=str(e),
+            )
+            return None
 
     def load_walnut_from_directory(self, walnut_id: str, image_directory: Path) -> Optional[WalnutFileDAO]:
         """
@@ -81,50 +256,26 @@ class WalnutImageFileReader(IWalnutImageFileReader):
         Returns:
             WalnutFileDAO with all images loaded, or None if directory doesn't exist
         """
-        if not image_directory.exists() or not image_directory.is_dir():
+        # Same single-scan grouping as load_all_from_directory, restricted to this walnut's files
+        files_by_walnut = self._scan_image_files(image_directory, walnut_id)
+        if not files_by_walnut:
             return None
+        return self._load_grouped_images(image_directory, files_by_walnut).get(walnut_id)
 
-        images: List[WalnutImageFileDAO] = []
+    def load_all_from_directory(self, image_directory: Path) -> Dict[str, WalnutFileDAO]:
+        """
+        Load the images of every walnut found in a directory, grouped by walnut ID.
 
-        # Look for image files matching the pattern
-        for file_path in image_directory.glob(f"{walnut_id}_*.jpg"):
-            side_letter = self._parse_filename(file_path)
-            if side_letter is None:
-                continue
+        The directory is scanned once and file names are matched against one precompiled pattern, so loading
+        W walnuts from a shared directory costs one pass over it instead of W; all files then load on one pool.
 
-            try:
-                # Load image to get dimensions
-                with Image.open(file_path) as img:
-                    width, height = img.size
-
-                # Get file size
-                file_size = file_path.stat().st_size
-
-                # Calculate checksum
-                checksum = self._calculate_checksum(file_path)
-
-                image_dao = WalnutImageFileDAO(
-                    file_path=file_path,
-                    side_letter=side_letter,
-                    width=width,
-                    height=height,
-                    file_size=file_size,
-                    checksum=checksum,
-                )
-                images.append(image_dao)
-            except Exception as e:
-                self.logger.warning(
-                    "image_load_error",
-                    file_path=str(file_path),
-                    error=str(e),
-                )
-                continue
-
-        if not images:
-            return None
+        Args:
+            image_directory: Path to the directory containing images
 
-        return WalnutFileDAO(
-            walnut_id=walnut_id,
-            image_directory=image_directory,
-            images=images,
-        )
+        Returns:
+            Mapping of walnut ID to its WalnutFileDAO (empty if the directory doesn't exist or has no images)
+        """
+        files_by_walnut = self._scan_image_files(image_directory)
+        if not files_by_walnut:
+            return {}
+        return self._load_grouped_images(image_directory, files_by_walnut)
@@ -8,8 +8,15 @@ from typing import List
 import cv2
 import numpy as np
 
+from common.enums import ImageFileFormatEnum
 from common.logger import get_logger
 
+# JPEG encoder settings; 95 matches cv2.imwrite's default, and the optimize pass (a second Huffman pass) stays off
+DEFAULT_JPEG_QUALITY = 95
+DEFAULT_JPEG_OPTIMIZE = False
+# Quality above 100 selects lossless WebP
+WEBP_LOSSLESS_QUALITY = 101
+
 
 class IImageFileWriter(ABC):
     """Interface for writing image files to filesystem."""
@@ -59,27 +66,52 @@ class IImageFileWriter(ABC):
 class ImageFileWriter(IImageFileWriter):
     """Implementation of image file writer."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        image_format: ImageFileFormatEnum = ImageFileFormatEnum.JPEG,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+        jpeg_optimize: bool = DEFAULT_JPEG_OPTIMIZE,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            image_format: File format for saved images (also decides the extension used by build_image_path)
+            jpeg_quality: JPEG quality (0-100), only used for ImageFileFormatEnum.JPEG
+            jpeg_optimize: Whether to run the extra Huffman optimization pass, only used for ImageFileFormatEnum.JPEG
+        """
         self.logger = get_logger(__name__)
+        self.image_format: ImageFileFormatEnum = image_format
+        self.encode_extension: str = f".{image_format.value}"
+        if image_format == ImageFileFormatEnum.WEBP:
+            self.encode_params: List[int] = [cv2.IMWRITE_WEBP_QUALITY, WEBP_LOSSLESS_QUALITY]
+        else:
+            self.encode_params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality, cv2.IMWRITE_JPEG_OPTIMIZE, int(jpeg_optimize)]
 
     async def ensure_directories_async(self, roles: List[str], base_path: str) -> None:
         """Ensure directories exist for all roles."""
         base = Path(base_path)
-        for role in roles:
-            role_dir = base / role
-            # Run in thread pool since Path.mkdir is blocking
-            await asyncio.to_thread(role_dir.mkdir, parents=True, exist_ok=True)
+        # Run in thread pool since Path.mkdir is blocking; all roles at once (exist_ok makes the shared parents race-free)
+        await asyncio.gather(*(asyncio.to_thread((base / role).mkdir, parents=True, exist_ok=True) for role in roles))
 
     async def save_image_async(self, image: np.ndarray, path: str) -> bool:
         """Save an image to the specified path."""
         try:
-            # Run cv2.imwrite in thread pool since it's blocking
-            success = await asyncio.to_thread(cv2.imwrite, path, image)
-            if success:
+            if self.image_format == ImageFileFormatEnum.NPY:
+                # Raw array dump: no encode step, just the .npy header and the pixel buffer
+                await asyncio.to_thread(np.save, path, image)
                 self.logger.info(f"Saved image to {path}")
-            else:
+                return True
+
+            # Encode in memory and write the bytes as two separate thread-pool jobs (both blocking), so the encoder
+            # thread is never held while the file drains to disk
+            success, buffer = await asyncio.to_thread(cv2.imencode, self.encode_extension, image, self.encode_params)
+            if not success:
                 self.logger.error(f"Failed to save image to {path}")
-            return success
+                return False
+            await asyncio.to_thread(Path(path).write_bytes, buffer)
+            self.logger.info(f"Saved image to {path}")
+            return True
         except Exception as e:
             self.logger.error(f"Error saving image to {path}: {e}")
             return False
@@ -88,6 +120,6 @@ class ImageFileWriter(IImageFileWriter):
         """Build the full path for an image file."""
         base = Path(base_path)
         role_dir = base / role
-        filename = f"{capture_id}_{suffix}.jpg"
+        filename = f"{capture_id}_{suffix}.{self.image_format.value}"
         return str(role_dir / filename)
 
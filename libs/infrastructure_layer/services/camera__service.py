@@ -12,6 +12,9 @@ from common.logger import get_logger
 # Type alias for camera handle
 CameraHandle = cv2.VideoCapture
 
+# Max camera indices probed at the same time by scan_available_cameras_async
+CAMERA_SCAN_CONCURRENCY = 4
+
 
 class ICameraService(ABC):
     """Interface for camera operations."""
@@ -97,6 +100,37 @@ class CameraService(ICameraService):
         except Exception:
             pass
 
+    @staticmethod
+    def _probe_camera(index: int, backend: int) -> bool:
+        """Open, check and release a camera in one blocking call (run via a single to_thread hop)."""
+        cap = cv2.VideoCapture(index, backend)
+        if cap and cap.isOpened():
+            cap.release()
+            return True
+        return False
+
+    @staticmethod
+    def _open_configured_camera(
+        index: int, backend: int, width: int, height: int, buffer_size: int, fourcc: str, auto_exposure: float
+    ) -> Optional[CameraHandle]:
+        """
+        Open a camera and apply all capture settings in one blocking call (run via a single to_thread hop).
+
+        Returns the configured handle, or None (with the handle released) if the backend couldn't open the camera.
+        """
+        cap = cv2.VideoCapture(index, backend)
+        if not (cap and cap.isOpened()):
+            if cap:
+                cap.release()
+            return None
+        # Configure camera settings - cheap property sets, so they share the hop instead of one each
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, auto_exposure)
+        return cap
+
     async def test_camera_available_async(self, index: int) -> bool:
         """
         Quick test if camera index is available.
@@ -107,18 +141,14 @@ class CameraService(ICameraService):
         try:
             # Use MSMF backend for testing (more reliable on Windows)
             # Run in thread pool since cv2.VideoCapture is blocking
-            cap = await asyncio.to_thread(cv2.VideoCapture, index, cv2.CAP_MSMF)
-            if cap and cap.isOpened():
-                await asyncio.to_thread(cap.release)
+            if await asyncio.to_thread(self._probe_camera, index, cv2.CAP_MSMF):
                 self.logger.debug(f"Camera {index} is available (MSMF)")
                 return True
         except Exception as e:
             self.logger.debug(f"Camera {index} test failed with MSMF: {e}")
             # Try fallback to CAP_ANY if MSMF fails (for non-Windows systems)
             try:
-                cap = await asyncio.to_thread(cv2.VideoCapture, index, cv2.CAP_ANY)
-                if cap and cap.isOpened():
-                    await asyncio.to_thread(cap.release)
+                if await asyncio.to_thread(self._probe_camera, index, cv2.CAP_ANY):
                     self.logger.debug(f"Camera {index} is available (CAP_ANY)")
                     return True
             except Exception:
@@ -133,20 +163,13 @@ class CameraService(ICameraService):
         
         for backend in backends:
             try:
-                # Try to open camera with this backend
-                cap = await asyncio.to_thread(cv2.VideoCapture, index, backend)
-                if cap and cap.isOpened():
-                    # Configure camera settings
-                    await asyncio.to_thread(cap.set, cv2.CAP_PROP_BUFFERSIZE, buffer_size)
-                    await asyncio.to_thread(cap.set, cv2.CAP_PROP_FRAME_WIDTH, width)
-                    await asyncio.to_thread(cap.set, cv2.CAP_PROP_FRAME_HEIGHT, height)
-                    await asyncio.to_thread(cap.set, cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
-                    await asyncio.to_thread(cap.set, cv2.CAP_PROP_AUTO_EXPOSURE, auto_exposure)
+                # Open and configure the camera with this backend in one thread-pool hop
+                cap = await asyncio.to_thread(
+                    self._open_configured_camera, index, backend, width, height, buffer_size, fourcc, auto_exposure
+                )
+                if cap is not None:
                     self.logger.info(f"Opened camera {index} with backend {backend}")
                     return cap
-                else:
-                    if cap:
-                        await asyncio.to_thread(cap.release)
             except Exception as e:
                 self.logger.warning(f"Failed to open camera {index} with backend {backend}: {e}")
                 continue
@@ -176,10 +199,13 @@ class CameraService(ICameraService):
 
     async def scan_available_cameras_async(self, max_index: int) -> List[int]:
         """Scan for available cameras."""
-        found: List[int] = []
-        # Test camera indices 0 to max_index
-        for i in range(max_index + 1):
-            if await self.test_camera_available_async(i):
-                found.append(i)
-        return found
+        # Probe camera indices 0 to max_index concurrently, a few at a time so capture drivers aren't hammered
+        semaphore = asyncio.Semaphore(CAMERA_SCAN_CONCURRENCY)
+
+        async def probe(index: int) -> bool:
+            async with semaphore:
+                return await self.test_camera_available_async(index)
+
+        results = await asyncio.gather(*(probe(i) for i in range(max_index + 1)))
+        return [i for i, available in enumerate(results) if available]
 
@@ -1,12 +1,18 @@
 # infrastructure_layer/services/image_object__finder.py
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
 
+from common.enums import ImageBlurMethodEnum
+
 
 # =========================
 # Constants
@@ -21,6 +27,12 @@ BROWN_SAT_MIN = 50
 BROWN_VAL_MIN = 50
 BROWN_VAL_MAX = 200
 
+# The same range as inclusive HSV bounds for cv2.inRange (main hue band and the red-brown wrap-around band)
+_BROWN_HSV_LOWER = np.array([BROWN_HUE_MIN, BROWN_SAT_MIN, BROWN_VAL_MIN], dtype=np.uint8)
+_BROWN_HSV_UPPER = np.array([BROWN_HUE_MAX, 255, BROWN_VAL_MAX], dtype=np.uint8)
+_BROWN_HSV_WRAP_LOWER = np.array([BROWN_HUE_WRAP_MIN, BROWN_SAT_MIN, BROWN_VAL_MIN], dtype=np.uint8)
+_BROWN_HSV_WRAP_UPPER = np.array([BROWN_HUE_WRAP_MAX, 255, BROWN_VAL_MAX], dtype=np.uint8)
+
 # Image processing parameters
 BLUR_DIAMETER = 9
 BLUR_SIGMA_COLOR = 75
@@ -31,6 +43,9 @@ MORPH_KERNEL_SIZE = 5
 CANNY_LOW_THRESHOLD = 50
 CANNY_HIGH_THRESHOLD = 150
 
+# Closing kernel for the morphological cleanup, built once instead of on every image
+_MORPH_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (MORPH_KERNEL_SIZE, MORPH_KERNEL_SIZE))
+
 # Object filtering thresholds
 MIN_AREA_FOR_DETECTION = 500
 MIN_AREA_FOR_CANDIDATE = 1000
@@ -38,6 +53,21 @@ MIN_BROWN_SCORE = 0.3
 MAX_CIRCULARITY_FOR_PILLARS = 0.95
 BORDER_MARGIN = 10
 
+# Threads analyzing contours of one image (the OpenCV/NumPy work per contour releases the GIL); one in
+# find_objects_batch worker processes, which already keep every CPU busy
+MAX_CONTOUR_WORKERS = os.cpu_count() or 1
+
+# Background threads encoding and writing debug images (PNG encoding releases the GIL); in
+# find_objects_batch worker processes the CPUs are split between the processes' write pools instead
+MAX_DEBUG_WRITE_WORKERS = os.cpu_count() or 1
+# PNG compression level for debug images (OpenCV default: 3); the masks and overlays are low-entropy,
+# so level 1 encodes several times faster for slightly larger files
+DEBUG_PNG_COMPRESSION = 1
+
+# Worker processes for find_objects_batch, and the most images each one takes per dispatch
+MAX_BATCH_WORKERS = os.cpu_count() or 1
+BATCH_CHUNK_SIZE = 8
+
 # Scoring weights
 SCORE_BROWN_WEIGHT = 0.4
 SCORE_AREA_WEIGHT = 0.25
@@ -52,6 +82,48 @@ IDEAL_CIRCULARITY_MAX = 0.9
 CIRCULARITY_PENALTY_FACTOR = 0.5
 
 
+# =========================
+# Worker Pools
+# =========================
+
+# Contour analysis threads per image in this process
+_contour_workers = MAX_CONTOUR_WORKERS
+
+# One write pool per process, shared by every finder and created on first use
+_debug_write_pool: Optional[ThreadPoolExecutor] = None
+_debug_write_workers = MAX_DEBUG_WRITE_WORKERS
+_debug_write_pool_lock = threading.Lock()
+
+
+def _get_debug_write_pool() -> ThreadPoolExecutor:
+    """Return the process-wide debug write pool, creating it on first use."""
+    global _debug_write_pool
+    with _debug_write_pool_lock:
+        if _debug_write_pool is None:
+            _debug_write_pool = ThreadPoolExecutor(
+                max_workers=_debug_write_workers, thread_name_prefix="image-object-finder-debug"
+            )
+        return _debug_write_pool
+
+
+def _init_batch_worker(debug_write_workers: int, contour_workers: int) -> None:
+    """
+    Initialize a find_objects_batch worker process.
+    
+    Sizes the worker's contour analysis threads and debug write pool to its share of the CPUs, and drops
+    a write pool inherited through fork (its threads don't exist in the child).
+    """
+    global _contour_workers, _debug_write_pool, _debug_write_workers
+    _contour_workers = contour_workers
+    _debug_write_pool = None
+    _debug_write_workers = debug_write_workers
+
+
+def _write_debug_image(path: Path, image: np.ndarray) -> None:
+    """Encode and write a debug image as PNG."""
+    cv2.imwrite(str(path), image, [cv2.IMWRITE_PNG_COMPRESSION, DEBUG_PNG_COMPRESSION])
+
+
 # =========================
 # Data Structures
 # =========================
@@ -69,11 +141,18 @@ class ObjectDetectionResult:
 
 @dataclass
 class DetectedObject:
-    """Extended result with additional features for filtering and scoring."""
+    """
+    Extended result with additional features for filtering and scoring.
+    
+    texture_score and brown_score stay 0.0 for objects whose appearance wasn't analyzed
+    (see the appearance_filter of ImageObjectFinder._find_all_objects_detailed).
+    """
     contour: np.ndarray
     area: float
     width_px: float
     height_px: float
+    bbox_x: int  # Top-left corner of the bounding rect (width_px x height_px)
+    bbox_y: int
     center_x: float
     center_y: float
     aspect_ratio: float
@@ -129,6 +208,26 @@ class IImageObjectFinder(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_objects_batch(
+        self,
+        image_paths: List[str],
+        background_is_white: bool = True,
+        intermediate_dir: Optional[str] = None,
+    ) -> List[Optional[ObjectDetectionResult]]:
+        """
+        Find the walnut in each of several images.
+        
+        Args:
+            image_paths: Paths to the image files
+            background_is_white: Whether background is white (default: True)
+            intermediate_dir: Optional directory path to save intermediate images
+        
+        Returns:
+            One find_object result per image path, in the same order
+        """
+        pass
+
 
 # =========================
 # Implementation
@@ -150,6 +249,49 @@ class ImageObjectFinder(IImageObjectFinder):
     9. Feature extraction and scoring
     """
 
+    def __init__(
+        self,
+        blur_method: ImageBlurMethodEnum = ImageBlurMethodEnum.BILATERAL,
+        detection_scale: int = 1,
+        detection_min_dim: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the object finder.
+        
+        Args:
+            blur_method: Smoothing filter for step 4 (default: bilateral, the original behavior;
+                gaussian is a much cheaper separable blur)
+            detection_scale: Integer downsampling factor for steps 4-8 (default: 1, full resolution).
+                With 2, blur, threshold, morphology and contour finding run on a quarter of the pixels;
+                contours are scaled back up, so features and scores stay in full-resolution units.
+            detection_min_dim: Optional smallest side (in pixels) to downsample each image to
+                (default: None, only detection_scale applies). The factor is picked per image as
+                min(height, width) // detection_min_dim, but never below detection_scale.
+        
+        Raises:
+            ValueError: If detection_scale or detection_min_dim is less than 1
+        """
+        if detection_scale < 1:
+            raise ValueError(f"detection_scale must be >= 1, got {detection_scale}")
+        if detection_min_dim is not None and detection_min_dim < 1:
+            raise ValueError(f"detection_min_dim must be >= 1, got {detection_min_dim}")
+        self.blur_method = blur_method
+        self.detection_scale = detection_scale
+        self.detection_min_dim = detection_min_dim
+        # Per-thread scratch buffer for debug overlays (the finder is shared as a singleton)
+        self._overlay_buffers = threading.local()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the configuration only (find_objects_batch ships the finder to worker processes)."""
+        state = self.__dict__.copy()
+        del state["_overlay_buffers"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the configuration with fresh scratch buffers."""
+        self.__dict__.update(state)
+        self._overlay_buffers = threading.local()
+
     def find_object(
         self,
         image_path: str,
@@ -167,7 +309,7 @@ class ImageObjectFinder(IImageObjectFinder):
         
         Returns the best candidate based on scoring.
         """
-        # Load image to get dimensions for border checking
+        # Decode the image once; the same array feeds detection, border checks and all output images
         image = cv2.imread(image_path)
         if image is None:
             return None
@@ -182,6 +324,13 @@ class ImageObjectFinder(IImageObjectFinder):
             min_area=MIN_AREA_FOR_DETECTION,
             matched_object=None,  # Don't save objects yet
             save_objects=False,  # Skip object saving for now
+            image=image,
+            # Only objects that survive the cheap geometry filters need appearance scores,
+            # unless debug images (whose names carry every object's scores) are being saved
+            appearance_filter=(
+                None if intermediate_dir
+                else lambda obj: not self._fails_geometry_filters(obj, image_width, image_height)
+            ),
         )
         if not all_objects:
             return None
@@ -201,19 +350,46 @@ class ImageObjectFinder(IImageObjectFinder):
         
         # Now save all objects with match indicator
         if intermediate_dir:
-            image = cv2.imread(image_path)
-            if image is not None:
-                self._save_all_objects_with_scores(
-                    image, all_objects, matched_obj, intermediate_dir, image_path
-                )
+            self._save_all_objects_with_scores(
+                image, all_objects, matched_obj, intermediate_dir, image_path
+            )
         
         # Always save matched object only to image_root/walnut_id/_masked/ (regardless of intermediate_dir)
-        image = cv2.imread(image_path)
-        if image is not None:
-            self._save_matched_object_only(image, matched_obj, image_path)
+        self._save_matched_object_only(image, matched_obj, image_path)
         
         return self._convert_to_result(matched_obj)
 
+    def find_objects_batch(
+        self,
+        image_paths: List[str],
+        background_is_white: bool = True,
+        intermediate_dir: Optional[str] = None,
+    ) -> List[Optional[ObjectDetectionResult]]:
+        """
+        Find the walnut in each of several images.
+        
+        Images are spread over worker processes (the Python-side work of find_object holds the GIL,
+        so threads wouldn't scale); a single image is processed in-process. Each call starts its own
+        process pool, so this pays off for many images at once rather than one walnut's few sides.
+        """
+        find = partial(
+            self.find_object,
+            background_is_white=background_is_white,
+            intermediate_dir=intermediate_dir,
+        )
+        if len(image_paths) <= 1 or MAX_BATCH_WORKERS <= 1:
+            return [find(image_path) for image_path in image_paths]
+        
+        workers = min(MAX_BATCH_WORKERS, len(image_paths))
+        # Chunks amortize the inter-process round trips, but small batches still get spread over all workers
+        chunk_size = max(1, min(BATCH_CHUNK_SIZE, len(image_paths) // workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(max(1, MAX_DEBUG_WRITE_WORKERS // workers), 1),
+        ) as executor:
+            return list(executor.map(find, image_paths, chunksize=chunk_size))
+
     def find_all_objects(
         self,
         image_path: str,
@@ -226,6 +402,7 @@ class ImageObjectFinder(IImageObjectFinder):
             intermediate_dir=None,
             background_is_white=background_is_white,
             min_area=min_contour_size,
+            appearance_filter=lambda obj: False,  # Results carry geometry only
         )
         
         return [self._convert_to_result(obj) for obj in detected_objects]
@@ -242,10 +419,16 @@ class ImageObjectFinder(IImageObjectFinder):
         min_area: int = 300,
         matched_object: Optional[DetectedObject] = None,
         save_objects: bool = True,
+        image: Optional[np.ndarray] = None,
+        appearance_filter: Optional[Callable[[DetectedObject], bool]] = None,
     ) -> List[DetectedObject]:
         """
         Main processing pipeline to detect objects.
         
+        If image is given (already decoded from image_path), it is used as-is instead of reading the file again.
+        If appearance_filter is given, the texture and brown scores (the per-object cost that scales with
+        object size) are only computed for objects it accepts; the others keep 0.0.
+        
         Steps:
         1. Load image and convert to HSV
         2. Create brown mask
@@ -259,49 +442,62 @@ class ImageObjectFinder(IImageObjectFinder):
         10. Extract features
         """
         # Load image first to get name for directory structure
-        image = self._load_image(image_path)
+        if image is None:
+            image = self._load_image(image_path)
         out_dir = self._setup_output_directory(intermediate_dir, image_path)
+        # Intermediate images are only built and written when an output directory was requested
+        debug = out_dir is not None
+        # Background writes of the intermediate images; all are waited for before returning
+        pending_writes: List[Future[None]] = []
         hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
         
         # Create brown mask and apply to image
         brown_mask = self._create_brown_mask(hsv)
-        self._save_intermediate(out_dir, "00_brown_mask.png", brown_mask * 255)
-        
-        masked_image = cv2.bitwise_and(image, image, mask=brown_mask)
-        self._save_intermediate(out_dir, "01_masked_image.png", masked_image)
         
         # Image processing pipeline
-        gray = cv2.cvtColor(masked_image, cv2.COLOR_BGR2GRAY)
-        self._save_intermediate(out_dir, "02_gray.png", gray)
-        
-        blur = cv2.bilateralFilter(
-            gray, BLUR_DIAMETER, BLUR_SIGMA_COLOR, BLUR_SIGMA_SPACE
-        )
-        self._save_intermediate(out_dir, "03_blur.png", blur)
-        
-        thresh = self._adaptive_threshold(blur, background_is_white)
-        self._save_intermediate(out_dir, "04_threshold.png", thresh)
-        
+        # Grayscale maps black to black pixel by pixel, so masking after the conversion gives the same
+        # result as converting the masked color image, without a full-size masked BGR copy
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        cv2.bitwise_and(gray, brown_mask, dst=gray)  # brown_mask is 0/255, so this zeroes non-brown pixels in place
+        scale = self._detection_scale_for(gray)
+        blur = self._blur(self._downsample(gray, scale))
+        thresh = self._adaptive_threshold(blur, background_is_white, scale)
         cleaned = self._morphological_cleanup(thresh)
-        self._save_intermediate(out_dir, "05_cleaned.png", cleaned)
         
-        edges = cv2.Canny(gray, CANNY_LOW_THRESHOLD, CANNY_HIGH_THRESHOLD)
-        self._save_intermediate(out_dir, "06_edges.png", edges)
+        if debug:
+            self._save_intermediate(out_dir, "00_brown_mask.png", brown_mask, pending_writes)
+            masked_image = cv2.bitwise_and(image, image, mask=brown_mask)
+            self._save_intermediate(out_dir, "01_masked_image.png", masked_image, pending_writes)
+            self._save_intermediate(out_dir, "02_gray.png", gray, pending_writes)
+            self._save_intermediate(out_dir, "03_blur.png", blur, pending_writes)
+            self._save_intermediate(out_dir, "04_threshold.png", thresh, pending_writes)
+            self._save_intermediate(out_dir, "05_cleaned.png", cleaned, pending_writes)
+            # The edge map is only a visualization: the texture score doesn't read edge values
+            edges = cv2.Canny(gray, CANNY_LOW_THRESHOLD, CANNY_HIGH_THRESHOLD)
+            self._save_intermediate(out_dir, "06_edges.png", edges, pending_writes)
         
         # Find and analyze contours
         contours, _ = cv2.findContours(
             cleaned, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
+        if scale > 1:
+            # Back to full-resolution coordinates for feature extraction and output
+            contours = [contour * scale for contour in contours]
         
         objects = self._extract_objects_from_contours(
-            contours, gray, edges, hsv, image, min_area, out_dir, matched_object, save_objects
+            contours, brown_mask, image, min_area, out_dir, matched_object, save_objects,
+            appearance_filter,
         )
         
         # Save final overlay
-        if out_dir:
-            overlay = image.copy()
+        if debug:
+            overlay = self._overlay_canvas(image)
             cv2.drawContours(overlay, [o.contour for o in objects], -1, (0, 0, 255), 2)
-            cv2.imwrite(str(out_dir / "07_all_contours.png"), overlay)
+            self._save_intermediate(out_dir, "07_all_contours.png", overlay, pending_writes)
+        
+        # The arrays (including the reused overlay buffer) must not change before their writes finish
+        for future in pending_writes:
+            future.result()
         
         return sorted(objects, key=lambda o: o.area, reverse=True)
 
@@ -336,31 +532,89 @@ class ImageObjectFinder(IImageObjectFinder):
             return out_dir
         return None
 
-    def _save_intermediate(self, out_dir: Optional[Path], filename: str, image: np.ndarray) -> None:
-        """Save intermediate processing result."""
+    def _overlay_canvas(self, image: np.ndarray) -> np.ndarray:
+        """
+        Copy the image into a reusable scratch buffer for drawing a debug overlay.
+        
+        The buffer is kept per thread and only reallocated when the image shape or dtype
+        changes, so consecutive debug runs don't allocate a full frame each time.
+        """
+        buffer = getattr(self._overlay_buffers, "buffer", None)
+        if buffer is None or buffer.shape != image.shape or buffer.dtype != image.dtype:
+            buffer = np.empty_like(image)
+            self._overlay_buffers.buffer = buffer
+        np.copyto(buffer, image)
+        return buffer
+
+    def _save_intermediate(
+        self,
+        out_dir: Optional[Path],
+        filename: str,
+        image: np.ndarray,
+        pending_writes: List[Future[None]],
+    ) -> None:
+        """
+        Save intermediate processing result on the background write pool.
+        
+        The write's future is appended to pending_writes; the caller waits for it before image can change.
+        """
         if out_dir:
-            cv2.imwrite(str(out_dir / filename), image)
+            pending_writes.append(self._submit_debug_write(out_dir / filename, image))
+
+    def _submit_debug_write(self, path: Path, image: np.ndarray) -> Future[None]:
+        """Encode and write a debug image on the background write pool (image must not change until done)."""
+        return _get_debug_write_pool().submit(_write_debug_image, path, image)
+
+    def _detection_scale_for(self, gray: np.ndarray) -> int:
+        """Pick the downsampling factor for an image from detection_scale and detection_min_dim."""
+        if self.detection_min_dim is None:
+            return self.detection_scale
+        return int(max(self.detection_scale, min(gray.shape[:2]) // self.detection_min_dim))
+
+    def _downsample(self, gray: np.ndarray, scale: int) -> np.ndarray:
+        """Shrink the grayscale image by scale (area averaging); returned as-is at scale 1."""
+        if scale == 1:
+            return gray
+        height, width = gray.shape[:2]
+        return cv2.resize(
+            gray,
+            (max(width // scale, 1), max(height // scale, 1)),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    def _blur(self, gray: np.ndarray) -> np.ndarray:
+        """Smooth the grayscale image with the configured blur method."""
+        if self.blur_method == ImageBlurMethodEnum.GAUSSIAN:
+            return cv2.GaussianBlur(gray, (BLUR_DIAMETER, BLUR_DIAMETER), 0)
+        return cv2.bilateralFilter(
+            gray, BLUR_DIAMETER, BLUR_SIGMA_COLOR, BLUR_SIGMA_SPACE
+        )
 
     def _adaptive_threshold(
-        self, blur: np.ndarray, background_is_white: bool
+        self, blur: np.ndarray, background_is_white: bool, scale: int = 1
     ) -> np.ndarray:
-        """Apply adaptive thresholding."""
+        """
+        Apply adaptive thresholding.
+        
+        On an image downsampled by scale, the neighborhood shrinks with it (kept odd and at least 3),
+        so the window still covers about the same area of the original image.
+        """
         threshold_type = (
             cv2.THRESH_BINARY_INV if background_is_white else cv2.THRESH_BINARY
         )
+        block_size = max(3, (THRESHOLD_BLOCK_SIZE // scale) | 1)
         return cv2.adaptiveThreshold(
             blur,
             255,
             cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
             threshold_type,
-            THRESHOLD_BLOCK_SIZE,
+            block_size,
             THRESHOLD_C,
         )
 
     def _morphological_cleanup(self, thresh: np.ndarray) -> np.ndarray:
         """Apply morphological operations to clean up threshold result."""
-        kernel = np.ones((MORPH_KERNEL_SIZE, MORPH_KERNEL_SIZE), np.uint8)
-        return cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+        return cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, _MORPH_KERNEL)
 
     # =========================
     # Color Detection
@@ -375,65 +629,52 @@ class ImageObjectFinder(IImageObjectFinder):
         - Saturation: 50-255 (moderate to high)
         - Value: 50-200 (moderate brightness)
         
+        Each hue band is one fused cv2.inRange pass over all three channels, instead of
+        a chain of full-frame NumPy comparisons each materializing a temporary bool array.
+        
         Returns:
             Binary mask (0 or 255) where 255 indicates brown pixels
         """
-        h = hsv[:, :, 0]  # Hue (0-179 in OpenCV)
-        s = hsv[:, :, 1]  # Saturation (0-255)
-        v = hsv[:, :, 2]  # Value/Brightness (0-255)
-        
-        # Brown hue range (including wrap-around)
-        brown_hue = (
-            ((h >= BROWN_HUE_MIN) & (h <= BROWN_HUE_MAX)) |
-            ((h >= BROWN_HUE_WRAP_MIN) & (h <= BROWN_HUE_WRAP_MAX))
-        )
-        
-        # Combined brown mask
-        brown_mask = (
-            brown_hue &
-            (s >= BROWN_SAT_MIN) &
-            (v >= BROWN_VAL_MIN) &
-            (v <= BROWN_VAL_MAX)
-        )
+        brown_mask = cv2.inRange(hsv, _BROWN_HSV_LOWER, _BROWN_HSV_UPPER)
+        wrap_mask = cv2.inRange(hsv, _BROWN_HSV_WRAP_LOWER, _BROWN_HSV_WRAP_UPPER)
+        return cv2.bitwise_or(brown_mask, wrap_mask, dst=brown_mask)
+
+    def _contour_roi_mask(
+        self, contour: np.ndarray, bounding_rect: Tuple[int, int, int, int]
+    ) -> np.ndarray:
+        """
+        Fill the contour into a mask covering only its bounding rect.
         
-        return brown_mask.astype(np.uint8)
+        The mask lines up with image[y:y + h, x:x + w], so callers touch the object's
+        pixels instead of allocating and scanning a full-frame mask per contour.
+        """
+        x, y, w, h = bounding_rect
+        mask = np.zeros((h, w), dtype=np.uint8)
+        cv2.drawContours(mask, [contour], -1, 255, -1, offset=(-x, -y))
+        return mask
 
-    def _brown_score(self, contour: np.ndarray, hsv: np.ndarray) -> float:
+    def _brown_score(
+        self,
+        contour_mask: np.ndarray,
+        brown_mask: np.ndarray,
+        bounding_rect: Tuple[int, int, int, int],
+    ) -> float:
         """
         Calculate how brown an object is (0-1).
         
-        Returns the ratio of brown pixels within the contour region.
+        Returns the ratio of brown pixels within the contour region. Reads the image-wide
+        brown mask computed once by the pipeline, so the HSV predicate isn't re-evaluated
+        per contour; contour_mask is the contour's bounding-rect mask.
         """
-        # Create mask for the contour region
-        mask = np.zeros(hsv.shape[:2], dtype=np.uint8)
-        cv2.drawContours(mask, [contour], -1, 255, -1)
-        
-        # Get HSV values within the contour
-        hsv_roi = hsv[mask == 255]
-        if len(hsv_roi) == 0:
+        total_pixel_count = cv2.countNonZero(contour_mask)
+        if total_pixel_count == 0:
             return 0.0
         
-        # Extract channels
-        h_values = hsv_roi[:, 0]
-        s_values = hsv_roi[:, 1]
-        v_values = hsv_roi[:, 2]
-        
-        # Brown color detection (same logic as mask creation)
-        brown_hue = (
-            ((h_values >= BROWN_HUE_MIN) & (h_values <= BROWN_HUE_MAX)) |
-            ((h_values >= BROWN_HUE_WRAP_MIN) & (h_values <= BROWN_HUE_WRAP_MAX))
-        )
-        brown_mask = (
-            brown_hue &
-            (s_values >= BROWN_SAT_MIN) &
-            (v_values >= BROWN_VAL_MIN) &
-            (v_values <= BROWN_VAL_MAX)
-        )
-        
-        brown_pixel_count = np.sum(brown_mask)
-        total_pixel_count = len(hsv_roi)
+        x, y, w, h = bounding_rect
+        brown_roi = brown_mask[y:y + h, x:x + w]
+        brown_pixel_count = cv2.countNonZero(cv2.bitwise_and(brown_roi, contour_mask))
         
-        return float(brown_pixel_count) / float(total_pixel_count) if total_pixel_count > 0 else 0.0
+        return float(brown_pixel_count) / float(total_pixel_count)
 
     # =========================
     # Feature Extraction
@@ -442,44 +683,61 @@ class ImageObjectFinder(IImageObjectFinder):
     def _extract_objects_from_contours(
         self,
         contours: List[np.ndarray],
-        gray: np.ndarray,
-        edges: np.ndarray,
-        hsv: np.ndarray,
+        brown_mask: np.ndarray,
         image: np.ndarray,
         min_area: int,
         out_dir: Optional[Path],
         matched_object: Optional[DetectedObject],
         save_objects: bool = True,
+        appearance_filter: Optional[Callable[[DetectedObject], bool]] = None,
     ) -> List[DetectedObject]:
         """Extract DetectedObject from contours."""
-        objects = []
-        
+        # Drop small contours up front so only real objects get scheduled; keep each one's index for debug
+        # names and its area, which the analysis reuses instead of computing it again
+        indexed_contours = []
         for idx, contour in enumerate(contours):
             area = cv2.contourArea(contour)
-            if area < min_area:
-                continue
-            
-            obj = self._analyze_contour(contour, gray, edges, hsv, image)
-            objects.append(obj)
-            
-            # Save per-object visualization with scores (if enabled)
-            if save_objects and out_dir:
+            if area >= min_area:
+                indexed_contours.append((idx, contour, area))
+        
+        # Geometry is cheap (O(perimeter)) and needed for every object
+        objects = [self._analyze_geometry(contour, area) for _, contour, area in indexed_contours]
+        
+        # Appearance scores cost O(bounding box) per object: only for the objects that need them
+        debug_dir = out_dir if save_objects else None
+        if appearance_filter is None or debug_dir is not None:
+            scored_objects = objects
+        else:
+            scored_objects = [obj for obj in objects if appearance_filter(obj)]
+        
+        def analyze_appearance(obj: DetectedObject) -> None:
+            self._analyze_appearance(obj, brown_mask)
+        
+        if len(scored_objects) > 1 and _contour_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(_contour_workers, len(scored_objects))) as executor:
+                list(executor.map(analyze_appearance, scored_objects))
+        else:
+            for obj in scored_objects:
+                analyze_appearance(obj)
+        
+        # Save per-object visualization with scores (if enabled), serially after the analysis
+        if debug_dir is not None:
+            pending_writes: List[Future[None]] = []
+            for (idx, _, _), obj in zip(indexed_contours, objects):
                 is_match = matched_object is not None and self._is_same_object(obj, matched_object)
-                self._save_object_debug(image, obj, idx, out_dir, is_match)
+                pending_writes.append(self._save_object_debug(image, obj, idx, debug_dir, is_match))
+            for future in pending_writes:
+                future.result()
         
         return objects
 
-    def _analyze_contour(
-        self,
-        contour: np.ndarray,
-        gray: np.ndarray,
-        edges: np.ndarray,
-        hsv: np.ndarray,
-        image: np.ndarray,
-    ) -> DetectedObject:
-        """Extract all features from a contour."""
+    def _analyze_geometry(self, contour: np.ndarray, area: float) -> DetectedObject:
+        """
+        Extract the shape features of a contour (area is its already computed cv2.contourArea).
+        
+        texture_score and brown_score are left at 0.0; _analyze_appearance fills them in.
+        """
         x, y, w, h = cv2.boundingRect(contour)
-        area = cv2.contourArea(contour)
         center_x = x + w / 2
         center_y = y + h / 2
         aspect_ratio = w / h if h > 0 else 0.0
@@ -489,33 +747,43 @@ class ImageObjectFinder(IImageObjectFinder):
             4 * np.pi * area / (perimeter ** 2) if perimeter > 0 else 0.0
         )
         
-        texture_score = self._texture_score(contour, edges)
-        brown_score = self._brown_score(contour, hsv)
-        
         return DetectedObject(
             contour=contour,
             area=float(area),
             width_px=float(w),
             height_px=float(h),
+            bbox_x=x,
+            bbox_y=y,
             center_x=float(center_x),
             center_y=float(center_y),
             aspect_ratio=float(aspect_ratio),
             circularity=float(circularity),
-            texture_score=float(texture_score),
-            brown_score=float(brown_score),
+            texture_score=0.0,
+            brown_score=0.0,
         )
 
-    def _texture_score(self, contour: np.ndarray, edges: np.ndarray) -> float:
+    def _analyze_appearance(
+        self,
+        obj: DetectedObject,
+        brown_mask: np.ndarray,
+    ) -> None:
+        """Compute an object's texture and brown scores in place."""
+        # One bounding-rect mask of the contour serves both region scores
+        bounding_rect = (obj.bbox_x, obj.bbox_y, int(obj.width_px), int(obj.height_px))
+        contour_mask = self._contour_roi_mask(obj.contour, bounding_rect)
+        obj.texture_score = float(self._texture_score(contour_mask))
+        obj.brown_score = float(self._brown_score(contour_mask, brown_mask, bounding_rect))
+
+    def _texture_score(self, contour_mask: np.ndarray) -> float:
         """
         Measure how textured an object is.
         
-        Returns the number of edge pixels within the contour region.
-        Walnuts have high texture (many edges), glass box has low texture.
+        Returns the number of pixels within the contour region (contour_mask is the contour's
+        bounding-rect mask). The score has always been the size of the edge map selection under the
+        contour mask, which counts every mask pixel whatever its edge value, so it is taken from the
+        mask directly and the full-image Canny pass isn't needed.
         """
-        mask = np.zeros(edges.shape, dtype=np.uint8)
-        cv2.drawContours(mask, [contour], -1, 255, -1)
-        edge_pixels = edges[mask == 255]
-        return float(len(edge_pixels))
+        return float(cv2.countNonZero(contour_mask))
 
     # =========================
     # Filtering and Scoring
@@ -530,32 +798,44 @@ class ImageObjectFinder(IImageObjectFinder):
         """
         Filter objects and calculate scores.
         
+        The filters and the scores are evaluated for all objects at once on feature arrays.
+        
         Returns list of (object, score) tuples for candidates that pass all filters.
         """
-        candidates = []
+        if not all_objects:
+            return []
         
-        for obj in all_objects:
-            # Apply filters
-            if self._should_filter_out(obj, image_width, image_height):
-                continue
-            
-            # Calculate score
-            score = self._calculate_score(obj)
-            candidates.append((obj, score))
+        areas = np.fromiter((obj.area for obj in all_objects), dtype=np.float64, count=len(all_objects))
+        circularities = np.fromiter(
+            (obj.circularity for obj in all_objects), dtype=np.float64, count=len(all_objects)
+        )
+        brown_scores = np.fromiter(
+            (obj.brown_score for obj in all_objects), dtype=np.float64, count=len(all_objects)
+        )
+        
+        # Filter out perfect circles (pillars), very small objects and non-brown objects
+        passes = (
+            (circularities <= MAX_CIRCULARITY_FOR_PILLARS) &
+            (areas >= MIN_AREA_FOR_CANDIDATE) &
+            (brown_scores >= MIN_BROWN_SCORE)
+        )
         
-        return candidates
+        # Filter out objects touching borders
+        survivors = [
+            all_objects[i] for i in np.flatnonzero(passes)
+            if not self._touches_border(all_objects[i], image_width, image_height)
+        ]
+        
+        scores = self._calculate_scores(survivors)
+        return list(zip(survivors, scores.tolist()))
 
-    def _should_filter_out(
+    def _fails_geometry_filters(
         self,
         obj: DetectedObject,
         image_width: int,
         image_height: int,
     ) -> bool:
-        """Check if object should be filtered out."""
-        # Filter out objects touching borders
-        if self._touches_border(obj, image_width, image_height):
-            return True
-        
+        """Check the shape-only filters, which don't need the texture or brown scores."""
         # Filter out perfect circles (pillars)
         if obj.circularity > MAX_CIRCULARITY_FOR_PILLARS:
             return True
@@ -564,38 +844,43 @@ class ImageObjectFinder(IImageObjectFinder):
         if obj.area < MIN_AREA_FOR_CANDIDATE:
             return True
         
-        # Filter out non-brown objects
-        if obj.brown_score < MIN_BROWN_SCORE:
+        # Filter out objects touching borders
+        if self._touches_border(obj, image_width, image_height):
             return True
         
         return False
 
-    def _calculate_score(self, obj: DetectedObject) -> float:
+    def _calculate_scores(self, objects: List[DetectedObject]) -> np.ndarray:
         """
-        Calculate composite score for object.
+        Calculate composite scores for objects, as an array aligned with objects.
         
         Higher score = better candidate for walnut.
         Combines brown color, area, circularity, and texture.
         """
+        count = len(objects)
+        areas = np.fromiter((obj.area for obj in objects), dtype=np.float64, count=count)
+        circularities = np.fromiter((obj.circularity for obj in objects), dtype=np.float64, count=count)
+        texture_scores = np.fromiter((obj.texture_score for obj in objects), dtype=np.float64, count=count)
+        brown_scores = np.fromiter((obj.brown_score for obj in objects), dtype=np.float64, count=count)
+        
         # Normalize features to 0-1 range
-        normalized_texture = min(obj.texture_score / MAX_TEXTURE_SCORE, 1.0)
-        normalized_area = min(obj.area / MAX_AREA_SCORE, 1.0)
+        normalized_texture = np.minimum(texture_scores / MAX_TEXTURE_SCORE, 1.0)
+        normalized_area = np.minimum(areas / MAX_AREA_SCORE, 1.0)
         
         # Prefer circularity in ideal range (walnut is close to circle but not perfect)
-        if IDEAL_CIRCULARITY_MIN <= obj.circularity <= IDEAL_CIRCULARITY_MAX:
-            circularity_score = obj.circularity
-        else:
-            circularity_score = obj.circularity * CIRCULARITY_PENALTY_FACTOR
+        circularity_scores = np.where(
+            (circularities >= IDEAL_CIRCULARITY_MIN) & (circularities <= IDEAL_CIRCULARITY_MAX),
+            circularities,
+            circularities * CIRCULARITY_PENALTY_FACTOR,
+        )
         
         # Weighted combination
-        score = (
-            SCORE_BROWN_WEIGHT * obj.brown_score +
+        return (
+            SCORE_BROWN_WEIGHT * brown_scores +
             SCORE_AREA_WEIGHT * normalized_area +
-            SCORE_CIRCULARITY_WEIGHT * circularity_score +
+            SCORE_CIRCULARITY_WEIGHT * circularity_scores +
             SCORE_TEXTURE_WEIGHT * normalized_texture
         )
-        
-        return score
 
     def _touches_border(
         self,
@@ -608,26 +893,15 @@ class ImageObjectFinder(IImageObjectFinder):
         
         Glass box edges typically touch borders, walnuts don't.
         """
-        # Check contour points
-        contour_points = obj.contour.reshape(-1, 2)
-        for point in contour_points:
-            px, py = point[0], point[1]  # (x, y) format from cv2
-            if (
-                px <= BORDER_MARGIN or px >= (image_width - BORDER_MARGIN) or
-                py <= BORDER_MARGIN or py >= (image_height - BORDER_MARGIN)
-            ):
-                return True
-        
-        # Check bounding box center
-        if (
-            obj.center_x <= BORDER_MARGIN or
-            obj.center_x >= (image_width - BORDER_MARGIN) or
-            obj.center_y <= BORDER_MARGIN or
-            obj.center_y >= (image_height - BORDER_MARGIN)
-        ):
-            return True
-        
-        return False
+        # The bounding rect spans exactly the extreme contour points (x..x+w-1, y..y+h-1), so checking
+        # its edges is the same as checking every point; the bounding box center lies inside it and
+        # needs no separate check
+        return (
+            obj.bbox_x <= BORDER_MARGIN or
+            obj.bbox_x + obj.width_px - 1 >= (image_width - BORDER_MARGIN) or
+            obj.bbox_y <= BORDER_MARGIN or
+            obj.bbox_y + obj.height_px - 1 >= (image_height - BORDER_MARGIN)
+        )
 
     def _convert_to_result(self, obj: DetectedObject) -> ObjectDetectionResult:
         """Convert DetectedObject to ObjectDetectionResult."""
@@ -651,16 +925,19 @@ class ImageObjectFinder(IImageObjectFinder):
         index: int,
         out_dir: Path,
         is_match: bool = False,
-    ) -> None:
+    ) -> Future[None]:
         """
         Save debug visualization for a single object with scores in filename.
         
+        The image is written on the background write pool; returns the write's future.
+        
         Filename format: object_{index:02d}_brownscore_{brown:.2f}_texturescore_{texture:.1f}_circularity_{circ:.2f}_area_{area:.0f}{_match}.png
         """
         debug_img = image.copy()
         cv2.drawContours(debug_img, [obj.contour], -1, (0, 255, 0), 2)
         
-        x, y, w, h = cv2.boundingRect(obj.contour)
+        x, y = obj.bbox_x, obj.bbox_y
+        w, h = int(obj.width_px), int(obj.height_px)
         cv2.rectangle(debug_img, (x, y), (x + w, y + h), (255, 0, 0), 2)
         
         # Build filename with scores
@@ -675,7 +952,7 @@ class ImageObjectFinder(IImageObjectFinder):
             filename += "_match"
         filename += ".png"
         
-        cv2.imwrite(str(out_dir / filename), debug_img)
+        return self._submit_debug_write(out_dir / filename, debug_img)
 
     def _save_all_objects_with_scores(
         self,
@@ -692,10 +969,13 @@ class ImageObjectFinder(IImageObjectFinder):
         out_dir = Path(intermediate_dir) / image_name
         out_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save all objects
-        for idx, obj in enumerate(all_objects):
-            is_match = self._is_same_object(obj, matched_obj)
-            self._save_object_debug(image, obj, idx, out_dir, is_match)
+        # Save all objects; matched_obj was picked from all_objects, so identity marks the match
+        pending_writes = [
+            self._save_object_debug(image, obj, idx, out_dir, obj is matched_obj)
+            for idx, obj in enumerate(all_objects)
+        ]
+        for future in pending_writes:
+            future.result()
 
     def _is_same_object(self, obj1: DetectedObject, obj2: DetectedObject) -> bool:
         """Check if two objects are the same (by comparing contour area and center)."""
@@ -1,11 +1,27 @@
 # infrastructure_layer/session_factory.py
 """SQLAlchemy session factory and database connection management."""
-from typing import Callable, Protocol
+from typing import Any, Callable, Protocol
 
 from common.interfaces import DatabaseConfig, IAppConfig
 from infrastructure_layer.data_access_objects.base__db_dao import Base
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Connection pool settings: keep warm asyncpg connections so sessions skip the TCP/auth handshake
+POOL_SIZE = 20
+POOL_MAX_OVERFLOW = 10
+POOL_RECYCLE_SECONDS = 1800
+
+# asyncpg statement caches (server-side prepared statements reused across executions)
+ASYNCPG_STATEMENT_CACHE_SIZE = 1024
+ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE = 256
+
+
+def _register_vector_codec(dbapi_connection: Any, connection_record: Any) -> None:
+    """Register pgvector's binary codec on a new asyncpg connection (embeddings travel as raw float32)."""
+    dbapi_connection.run_async(register_vector)
 
 
 class ISessionFactory(Protocol):
@@ -17,7 +33,15 @@ class ISessionFactory(Protocol):
 
 
 class SessionFactory:
-    """Factory for creating SQLAlchemy async sessions."""
+    """
+    Factory for creating SQLAlchemy async sessions.
+
+    All sessions share one engine whose queue pool keeps asyncpg connections (and their prepared
+    statement caches) warm, so creating a short-lived session per request or command is cheap.
+    Sessions are created with expire_on_commit=False: the DB writers rely on this to hand back
+    populated objects after commit without a refresh SELECT. Each new connection gets pgvector's binary
+    codec, which the embedding column type requires.
+    """
 
     def __init__(self, database_config: DatabaseConfig) -> None:
         """
@@ -32,14 +56,24 @@ class SessionFactory:
             f"@{database_config.host}:{database_config.port}/{database_config.database}"
         )
 
-        # Create async engine with pgvector support
+        # Create async engine with pgvector support and a pooled asyncpg connection set
         self.engine = create_async_engine(
             database_url,
             echo=False,  # Set to True for SQL query logging
+            poolclass=AsyncAdaptedQueuePool,
             pool_pre_ping=True,  # Verify connections before using
-            poolclass=NullPool,  # Use NullPool for async
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
+            pool_recycle=POOL_RECYCLE_SECONDS,
+            connect_args={
+                "statement_cache_size": ASYNCPG_STATEMENT_CACHE_SIZE,
+                "prepared_statement_cache_size": ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE,
+            },
         )
 
+        # Every pooled connection exchanges vector columns in binary (see Float32Vector)
+        event.listen(self.engine.sync_engine, "connect", _register_vector_codec)
+
         # Create async session factory
         self.SessionLocal: Callable[[], AsyncSession] = async_sessionmaker(
             bind=self.engine,
@@ -0,0 +1,95 @@
+"""Helpers shared by the database tests."""
+from typing import AsyncContextManager, Callable, List, Optional
+
+import numpy as np
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from infrastructure_layer.data_access_objects import WalnutDBDAO, WalnutImageDBDAO, WalnutImageEmbeddingDBDAO
+from infrastructure_layer.data_access_objects.walnut_comparison__db_dao import WalnutComparisonDBDAO
+
+# Opens a session on the test database (see the session_scope fixture)
+SessionScope = Callable[[], AsyncContextManager[AsyncSession]]
+
+EMBEDDING_DIM = 2048
+TEST_USER = "pytest"
+
+
+def record_statements(engine: AsyncEngine) -> List[str]:
+    """Collect the SQL text of every statement the engine sends from now on."""
+    statements: List[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    return statements
+
+
+async def count_rows(session: AsyncSession, table: str) -> int:
+    """Count the rows of a table."""
+    result = await session.execute(text(f"SELECT COUNT(*) FROM {table}"))
+    return int(result.scalar_one())
+
+
+def make_embedding(seed: int) -> np.ndarray:
+    """A reproducible float32 embedding."""
+    return np.random.default_rng(seed).standard_normal(EMBEDDING_DIM).astype(np.float32)
+
+
+def make_walnut(walnut_id: str, images: Optional[List[WalnutImageDBDAO]] = None) -> WalnutDBDAO:
+    """A walnut DAO with the given images."""
+    return WalnutDBDAO(
+        id=walnut_id,
+        description=f"walnut {walnut_id}",
+        width_mm=30.0,
+        height_mm=32.0,
+        thickness_mm=28.0,
+        created_by=TEST_USER,
+        updated_by=TEST_USER,
+        images=images or [],
+    )
+
+
+def make_image(side: str, embedding_seed: Optional[int] = None, walnut_id: str = "") -> WalnutImageDBDAO:
+    """An image DAO for one side, with an embedding when embedding_seed is given."""
+    image = WalnutImageDBDAO(
+        walnut_id=walnut_id,
+        side=side,
+        image_path=f"/images/{side}.jpg",
+        width=4000,
+        height=3000,
+        checksum=f"b3:{side}",
+        walnut_width_px=800.0,
+        walnut_height_px=850.0,
+        camera_distance_mm=300.0,
+        focal_length_px=3000.0,
+        created_by=TEST_USER,
+        updated_by=TEST_USER,
+    )
+    if embedding_seed is not None:
+        image.embedding = WalnutImageEmbeddingDBDAO(
+            model_name="resnet50",
+            embedding=make_embedding(embedding_seed),
+            created_by=TEST_USER,
+            updated_by=TEST_USER,
+        )
+    return image
+
+
+def make_comparison(walnut_id: str, compared_walnut_id: str, final_similarity: float) -> WalnutComparisonDBDAO:
+    """A comparison DAO between two walnuts."""
+    return WalnutComparisonDBDAO(
+        walnut_id=walnut_id,
+        compared_walnut_id=compared_walnut_id,
+        width_diff_mm=0.5,
+        height_diff_mm=0.25,
+        thickness_diff_mm=0.75,
+        basic_similarity=0.9,
+        width_weight=0.4,
+        height_weight=0.3,
+        thickness_weight=0.3,
+        final_similarity=final_similarity,
+        created_by=TEST_USER,
+        updated_by=TEST_USER,
+    )
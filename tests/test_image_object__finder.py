@@ -0,0 +1,118 @@
+"""Tests for ImageObjectFinder's batch and downsampled detection paths, on synthetic walnut photos."""
+from pathlib import Path
+from typing import List
+
+import cv2
+import numpy as np
+import pytest
+
+import infrastructure_layer.services.image_object__finder as image_object_finder
+from infrastructure_layer.services import ImageObjectFinder
+
+IMAGE_HEIGHT = 800
+IMAGE_WIDTH = 1000
+WALNUT_BGR = (40, 80, 140)  # Brown, inside the finder's HSV range
+
+
+def _write_walnut_image(path: Path, center: tuple, axes: tuple, seed: int) -> str:
+    """A textured brown ellipse on a white background."""
+    image = np.full((IMAGE_HEIGHT, IMAGE_WIDTH, 3), 255, dtype=np.uint8)
+    walnut = np.zeros((IMAGE_HEIGHT, IMAGE_WIDTH), dtype=np.uint8)
+    cv2.ellipse(walnut, center, axes, 0, 0, 360, 255, -1)
+    texture = np.random.default_rng(seed).integers(-25, 25, image.shape)
+    textured = np.clip(np.array(WALNUT_BGR) + texture, 0, 255).astype(np.uint8)
+    image[walnut > 0] = textured[walnut > 0]
+    cv2.imwrite(str(path), image)
+    return str(path)
+
+
+@pytest.fixture
+def image_paths(tmp_path: Path) -> List[str]:
+    return [
+        _write_walnut_image(tmp_path / "00001_F.png", (500, 400), (220, 170), seed=1),
+        _write_walnut_image(tmp_path / "00001_B.png", (450, 420), (180, 200), seed=2),
+        _write_walnut_image(tmp_path / "00001_L.png", (560, 380), (250, 150), seed=3),
+    ]
+
+
+def test_find_objects_batch_matches_find_object(image_paths: List[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    finder = ImageObjectFinder()
+    expected = [finder.find_object(image_path) for image_path in image_paths]
+
+    # Force the worker-process path even on single-CPU machines
+    monkeypatch.setattr(image_object_finder, "MAX_BATCH_WORKERS", 2)
+    results = finder.find_objects_batch(image_paths)
+
+    assert len(results) == len(image_paths)
+    for result, reference in zip(results, expected):
+        assert result is not None and reference is not None
+        assert result.area == reference.area
+        assert (result.center_x, result.center_y) == (reference.center_x, reference.center_y)
+        np.testing.assert_array_equal(result.contour, reference.contour)
+
+
+def test_find_objects_batch_writes_intermediate_images(
+    image_paths: List[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    finder = ImageObjectFinder()
+    # A debug write pool already running in this process must not leak into the forked workers
+    finder.find_object(image_paths[0], intermediate_dir=str(tmp_path / "warmup"))
+
+    monkeypatch.setattr(image_object_finder, "MAX_BATCH_WORKERS", 2)
+    intermediate_dir = tmp_path / "intermediate"
+    finder.find_objects_batch(image_paths, intermediate_dir=str(intermediate_dir))
+
+    for image_path in image_paths:
+        written = {path.name for path in (intermediate_dir / Path(image_path).stem).iterdir()}
+        assert {"00_brown_mask.png", "05_cleaned.png", "07_all_contours.png"} <= written
+
+
+def test_find_objects_batch_with_no_images() -> None:
+    assert ImageObjectFinder().find_objects_batch([]) == []
+
+
+
+def test_batch_workers_analyze_contours_serially(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Restored after the test: the initializer rewrites this process's pool settings
+    monkeypatch.setattr(image_object_finder, "_contour_workers", image_object_finder._contour_workers)
+    monkeypatch.setattr(image_object_finder, "_debug_write_pool", None)
+    monkeypatch.setattr(image_object_finder, "_debug_write_workers", image_object_finder._debug_write_workers)
+
+    image_object_finder._init_batch_worker(debug_write_workers=2, contour_workers=1)
+
+    assert image_object_finder._contour_workers == 1
+    assert image_object_finder._debug_write_workers == 2
+
+
+@pytest.mark.parametrize("finder_kwargs", [{"detection_scale": 2}, {"detection_min_dim": 400}])
+def test_downsampled_detection_matches_full_resolution(image_paths: List[str], finder_kwargs: dict) -> None:
+    full = ImageObjectFinder()
+    downsampled = ImageObjectFinder(**finder_kwargs)
+
+    for image_path in image_paths:
+        reference = full.find_object(image_path)
+        result = downsampled.find_object(image_path)
+        assert result is not None and reference is not None
+        # Features stay in full-resolution units, within the resolution lost to downsampling
+        assert result.area == pytest.approx(reference.area, rel=0.02)
+        assert result.width_px == pytest.approx(reference.width_px, abs=4)
+        assert result.height_px == pytest.approx(reference.height_px, abs=4)
+        assert result.center_x == pytest.approx(reference.center_x, abs=2)
+        assert result.center_y == pytest.approx(reference.center_y, abs=2)
+
+
+def test_detection_scale_per_image() -> None:
+    gray = np.zeros((IMAGE_HEIGHT, IMAGE_WIDTH), dtype=np.uint8)
+
+    assert ImageObjectFinder()._detection_scale_for(gray) == 1
+    assert ImageObjectFinder(detection_scale=3)._detection_scale_for(gray) == 3
+    scale = ImageObjectFinder(detection_min_dim=200)._detection_scale_for(gray)
+    assert scale == IMAGE_HEIGHT // 200 and type(scale) is int
+    # detection_scale is the floor for images already smaller than detection_min_dim
+    assert ImageObjectFinder(detection_scale=2, detection_min_dim=1000)._detection_scale_for(gray) == 2
+
+
+@pytest.mark.parametrize("finder_kwargs", [{"detection_scale": 0}, {"detection_min_dim": 0}])
+def test_rejects_invalid_detection_settings(finder_kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        ImageObjectFinder(**finder_kwargs)
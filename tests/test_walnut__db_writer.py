@@ -0,0 +1,81 @@
+"""Tests for WalnutDBWriter's image-replacing save and bulk insert paths."""
+import asyncio
+
+import numpy as np
+from db_helpers import SessionScope, count_rows, make_embedding, make_image, make_walnut, record_statements
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure_layer.data_access_objects import WalnutImageDBDAO, WalnutImageEmbeddingDBDAO
+from infrastructure_layer.db_readers import WalnutDBReader, WalnutImageDBReader
+from infrastructure_layer.db_writers import WalnutDBWriter, WalnutImageDBWriter, WalnutImageEmbeddingDBWriter
+
+
+def _walnut_writer(session: AsyncSession) -> WalnutDBWriter:
+    return WalnutDBWriter(session, WalnutImageDBWriter(session, WalnutImageEmbeddingDBWriter(session)))
+
+
+def test_save_with_images_replaces_existing_images(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        async with session_scope() as session:
+            walnut = make_walnut("W1", [make_image("front", embedding_seed=1), make_image("back", embedding_seed=2)])
+            await _walnut_writer(session).save_with_images_async(walnut)
+
+        # Save again from a fresh instance, as the application does after re-processing a walnut
+        async with session_scope() as session:
+            statements = record_statements(session.bind)
+            walnut = make_walnut("W1", [make_image("left", embedding_seed=3)])
+            await _walnut_writer(session).save_with_images_async(walnut)
+
+        # The old images go in one DELETE (embeddings follow through ON DELETE CASCADE), without loading them
+        deletes = [s for s in statements if s.startswith("DELETE")]
+        assert len(deletes) == 1
+        assert deletes[0].startswith(f"DELETE FROM {WalnutImageDBDAO.__tablename__} ")
+        assert not any(s.startswith("SELECT") and WalnutImageEmbeddingDBDAO.__tablename__ in s for s in statements)
+
+        async with session_scope() as session:
+            assert await count_rows(session, WalnutImageDBDAO.__tablename__) == 1
+            assert await count_rows(session, WalnutImageEmbeddingDBDAO.__tablename__) == 1
+            images = await WalnutImageDBReader(session).get_by_walnut_id_with_embeddings_async("W1")
+            assert [image.side for image in images] == ["left"]
+            assert images[0].embedding is not None
+            np.testing.assert_array_equal(images[0].embedding.embedding, make_embedding(3))
+
+    asyncio.run(scenario())
+
+
+def test_save_with_images_inserts_a_new_walnut(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        async with session_scope() as session:
+            saved = await _walnut_writer(session).save_with_images_async(
+                make_walnut("W2", [make_image("front", embedding_seed=4)])
+            )
+            assert all(image.id is not None for image in saved.images)
+
+        async with session_scope() as session:
+            walnut = await WalnutDBReader(session, WalnutImageDBReader(session)).get_by_id_with_images_async("W2")
+            assert walnut is not None
+            assert [image.side for image in walnut.images] == ["front"]
+
+    asyncio.run(scenario())
+
+
+def test_bulk_save_with_images_writes_ids_back(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        walnuts = [
+            make_walnut("W1", [make_image("front", embedding_seed=1), make_image("back", embedding_seed=2)]),
+            make_walnut("W2", [make_image("front", embedding_seed=3)]),
+        ]
+        async with session_scope() as session:
+            saved = await _walnut_writer(session).bulk_save_with_images_async(walnuts)
+
+        images = [image for walnut in saved for image in walnut.images]
+        assert all(image.id is not None and image.embedding.image_id == image.id for image in images)
+        assert [image.walnut_id for image in images] == ["W1", "W1", "W2"]
+
+        async with session_scope() as session:
+            assert await count_rows(session, WalnutImageDBDAO.__tablename__) == 3
+            stored = await WalnutImageDBReader(session).get_by_id_with_embedding_async(images[2].id)
+            assert stored is not None and stored.embedding is not None
+            np.testing.assert_array_equal(stored.embedding.embedding, make_embedding(3))
+
+    asyncio.run(scenario())
@@ -0,0 +1,133 @@
+"""Tests for WalnutComparisonDBWriter's upsert and COPY paths."""
+import asyncio
+
+from db_helpers import SessionScope, count_rows, make_comparison, make_walnut, record_statements
+from sqlalchemy import select
+
+from infrastructure_layer.data_access_objects.walnut_comparison__db_dao import WalnutComparisonDBDAO
+from infrastructure_layer.db_writers import WalnutComparisonDBWriter
+
+WALNUT_IDS = ("W1", "W2", "W3", "W4")
+
+
+async def _add_walnuts(session_scope: SessionScope) -> None:
+    async with session_scope() as session:
+        session.add_all([make_walnut(walnut_id) for walnut_id in WALNUT_IDS])
+        await session.commit()
+
+
+async def _stored_similarities(session_scope: SessionScope) -> dict:
+    async with session_scope() as session:
+        result = await session.scalars(select(WalnutComparisonDBDAO))
+        return {(c.walnut_id, c.compared_walnut_id): c.final_similarity for c in result.all()}
+
+
+def test_bulk_save_or_update_upserts_in_one_statement(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        await _add_walnuts(session_scope)
+        async with session_scope() as session:
+            writer = WalnutComparisonDBWriter(session)
+            first = await writer.bulk_save_or_update_async(
+                [make_comparison("W1", "W2", 0.5), make_comparison("W1", "W3", 0.6)]
+            )
+
+            statements = record_statements(session.bind)
+            second = await writer.bulk_save_or_update_async(
+                [make_comparison("W1", "W4", 0.7), make_comparison("W1", "W2", 0.9)]
+            )
+
+        # One INSERT ... ON CONFLICT ... RETURNING, no lookup SELECTs or refreshes
+        assert [s.split()[0] for s in statements if not s.startswith(("BEGIN", "COMMIT"))] == ["INSERT"]
+        assert "ON CONFLICT" in statements[0] and "RETURNING" in statements[0]
+
+        # RETURNING hands back the stored rows in input order, with generated columns populated
+        assert [(c.walnut_id, c.compared_walnut_id) for c in first] == [("W1", "W2"), ("W1", "W3")]
+        assert [(c.walnut_id, c.compared_walnut_id) for c in second] == [("W1", "W4"), ("W1", "W2")]
+        assert all(c.id is not None and c.created_at is not None for c in first + second)
+        # The existing pair was updated in place
+        assert second[1].id == first[0].id
+        assert second[1].final_similarity == 0.9
+
+        assert await _stored_similarities(session_scope) == {
+            ("W1", "W2"): 0.9,
+            ("W1", "W3"): 0.6,
+            ("W1", "W4"): 0.7,
+        }
+
+    asyncio.run(scenario())
+
+
+def test_bulk_save_or_update_keeps_the_last_of_a_duplicated_pair(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        await _add_walnuts(session_scope)
+        async with session_scope() as session:
+            saved = await WalnutComparisonDBWriter(session).bulk_save_or_update_async(
+                [make_comparison("W1", "W2", 0.1), make_comparison("W1", "W3", 0.2), make_comparison("W1", "W2", 0.3)]
+            )
+
+        # Every input position gets a result; both copies of the pair map to the one stored row
+        assert [(c.walnut_id, c.compared_walnut_id) for c in saved] == [("W1", "W2"), ("W1", "W3"), ("W1", "W2")]
+        assert saved[0] is saved[2]
+        assert saved[0].final_similarity == 0.3
+        assert await _stored_similarities(session_scope) == {("W1", "W2"): 0.3, ("W1", "W3"): 0.2}
+
+    asyncio.run(scenario())
+
+def test_bulk_save_or_update_with_no_comparisons(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        async with session_scope() as session:
+            assert await WalnutComparisonDBWriter(session).bulk_save_or_update_async([]) == []
+            assert await count_rows(session, WalnutComparisonDBDAO.__tablename__) == 0
+
+    asyncio.run(scenario())
+
+
+def test_save_or_update_returns_the_stored_row(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        await _add_walnuts(session_scope)
+        async with session_scope() as session:
+            writer = WalnutComparisonDBWriter(session)
+            inserted = await writer.save_or_update_async(make_comparison("W2", "W3", 0.4))
+            updated = await writer.save_or_update_async(make_comparison("W2", "W3", 0.8))
+            await session.commit()
+
+        assert updated.id == inserted.id
+        assert updated.final_similarity == 0.8
+        assert await _stored_similarities(session_scope) == {("W2", "W3"): 0.8}
+
+    asyncio.run(scenario())
+
+def test_bulk_copy_insert_writes_new_comparisons(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        await _add_walnuts(session_scope)
+        async with session_scope() as session:
+            written = await WalnutComparisonDBWriter(session).bulk_copy_insert_async(
+                [make_comparison("W1", "W2", 0.1), make_comparison("W1", "W3", 0.2), make_comparison("W2", "W3", 0.3)]
+            )
+
+        assert written == 3
+        assert await _stored_similarities(session_scope) == {
+            ("W1", "W2"): 0.1,
+            ("W1", "W3"): 0.2,
+            ("W2", "W3"): 0.3,
+        }
+
+    asyncio.run(scenario())
+
+
+def test_bulk_copy_insert_falls_back_to_upsert_for_existing_pairs(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        await _add_walnuts(session_scope)
+        async with session_scope() as session:
+            await WalnutComparisonDBWriter(session).bulk_save_or_update_async([make_comparison("W1", "W2", 0.1)])
+
+        async with session_scope() as session:
+            written = await WalnutComparisonDBWriter(session).bulk_copy_insert_async(
+                [make_comparison("W1", "W2", 0.5), make_comparison("W3", "W4", 0.6)]
+            )
+
+        assert written == 2
+        # The failed COPY left nothing behind; the upsert updated the existing pair and added the new one
+        assert await _stored_similarities(session_scope) == {("W1", "W2"): 0.5, ("W3", "W4"): 0.6}
+
+    asyncio.run(scenario())
@@ -0,0 +1,85 @@
+"""Tests for the Float32Vector column type."""
+import asyncio
+
+import numpy as np
+import pgvector
+import pytest
+from db_helpers import EMBEDDING_DIM, SessionScope, make_image, make_walnut
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from infrastructure_layer.data_access_objects import WalnutImageEmbeddingDBDAO
+from infrastructure_layer.data_access_objects.walnut_image_embedding__db_dao import Float32Vector
+
+DIALECT = asyncpg_dialect()
+
+
+def _result(value: object) -> object:
+    return Float32Vector(3).result_processor(DIALECT, None)(value)
+
+
+def test_bind_wraps_arrays_in_vectors() -> None:
+    bind = Float32Vector(3).bind_processor(DIALECT)
+    vector = pgvector.Vector([1.0, 2.0, 3.0])
+
+    assert bind(None) is None
+    assert bind(vector) is vector
+    bound = bind(np.array([1.0, 2.0, 3.0], dtype=np.float32))
+    assert isinstance(bound, pgvector.Vector)
+    np.testing.assert_array_equal(bound.to_numpy(), [1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pgvector.Vector([1.0, 2.5, -3.0]),
+        np.array([1.0, 2.5, -3.0], dtype=np.float64),
+        "[1,2.5,-3]",
+    ],
+    ids=["binary codec", "ndarray codec", "text"],
+)
+def test_results_are_float32_arrays(value: object) -> None:
+    result = _result(value)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, [1.0, 2.5, -3.0])
+
+
+def test_result_passes_null_through() -> None:
+    assert _result(None) is None
+
+
+def test_result_rejects_unexpected_types() -> None:
+    with pytest.raises(TypeError):
+        _result([1.0, 2.5, -3.0])
+
+
+def test_embedding_round_trip(session_scope: SessionScope) -> None:
+    vector = np.linspace(-1.0, 1.0, EMBEDDING_DIM, dtype=np.float32)
+
+    async def scenario() -> None:
+        async with session_scope() as session:
+            image = make_image("front", embedding_seed=0)
+            assert image.embedding is not None
+            image.embedding.embedding = vector
+            session.add(make_walnut("W1", [image]))
+            await session.commit()
+            embedding_id = image.embedding.id
+
+        async with session_scope() as session:
+            stored = await session.scalar(
+                select(WalnutImageEmbeddingDBDAO).where(WalnutImageEmbeddingDBDAO.id == embedding_id)
+            )
+            assert stored is not None
+            assert stored.embedding.dtype == np.float32
+            np.testing.assert_array_equal(stored.embedding, vector)
+
+            # The value PostgreSQL stored matches too, not just what comes back through the codec
+            text_value = await session.scalar(
+                text(f"SELECT embedding::text FROM {WalnutImageEmbeddingDBDAO.__tablename__} WHERE id = :id"),
+                {"id": embedding_id},
+            )
+            np.testing.assert_array_equal(np.array(text_value[1:-1].split(","), dtype=np.float32), vector)
+
+    asyncio.run(scenario())
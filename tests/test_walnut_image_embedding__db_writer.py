@@ -0,0 +1,110 @@
+"""Tests for WalnutImageEmbeddingDBWriter's batched paths (save_many_async and batch())."""
+import asyncio
+from typing import List
+
+import numpy as np
+import pytest
+from db_helpers import TEST_USER, SessionScope, count_rows, make_embedding, make_image, make_walnut, record_statements
+
+from infrastructure_layer.data_access_objects import WalnutImageEmbeddingDBDAO
+from infrastructure_layer.db_readers import WalnutImageEmbeddingDBReader
+from infrastructure_layer.db_writers import WalnutImageEmbeddingDBWriter
+
+SIDES = ("front", "back", "left")
+
+
+async def _add_images(session_scope: SessionScope) -> List[int]:
+    """Store a walnut with one image per side and no embeddings; returns the image ids."""
+    async with session_scope() as session:
+        walnut = make_walnut("W1", [make_image(side) for side in SIDES])
+        session.add(walnut)
+        await session.commit()
+        return [image.id for image in walnut.images]
+
+
+def _embeddings(image_ids: List[int]) -> List[WalnutImageEmbeddingDBDAO]:
+    return [
+        WalnutImageEmbeddingDBDAO(
+            image_id=image_id, model_name="resnet50", embedding=make_embedding(seed), created_by=TEST_USER, updated_by=TEST_USER
+        )
+        for seed, image_id in enumerate(image_ids)
+    ]
+
+
+async def _assert_stored(session_scope: SessionScope, embeddings: List[WalnutImageEmbeddingDBDAO]) -> None:
+    async with session_scope() as session:
+        reader = WalnutImageEmbeddingDBReader(session)
+        for seed, embedding in enumerate(embeddings):
+            stored = await reader.get_by_id_async(embedding.id)
+            assert stored is not None
+            assert stored.image_id == embedding.image_id
+            np.testing.assert_array_equal(stored.embedding, make_embedding(seed))
+
+
+def test_save_many_inserts_in_one_statement_and_assigns_ids(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        image_ids = await _add_images(session_scope)
+        embeddings = _embeddings(image_ids)
+        async with session_scope() as session:
+            statements = record_statements(session.bind)
+            saved = await WalnutImageEmbeddingDBWriter(session).save_many_async(embeddings)
+            await session.commit()
+
+        assert saved is embeddings
+        assert len({embedding.id for embedding in embeddings}) == len(embeddings)
+        assert [s.split()[0] for s in statements if not s.startswith(("BEGIN", "COMMIT"))] == ["INSERT"]
+        await _assert_stored(session_scope, embeddings)
+
+    asyncio.run(scenario())
+
+
+def test_save_many_rejects_missing_vectors(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        image_ids = await _add_images(session_scope)
+        embeddings = _embeddings(image_ids)
+        embeddings[1].embedding = None
+        async with session_scope() as session:
+            with pytest.raises(ValueError):
+                await WalnutImageEmbeddingDBWriter(session).save_many_async(embeddings)
+            assert await count_rows(session, WalnutImageEmbeddingDBDAO.__tablename__) == 0
+
+    asyncio.run(scenario())
+
+
+def test_batch_flushes_once_and_commits(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        image_ids = await _add_images(session_scope)
+        embeddings = _embeddings(image_ids)
+        async with session_scope() as session:
+            writer = WalnutImageEmbeddingDBWriter(session)
+            statements = record_statements(session.bind)
+            async with writer.batch():
+                for embedding in embeddings:
+                    await writer.save_async(embedding)
+                # Nothing is sent until the block exits
+                assert not [s for s in statements if s.startswith("INSERT")]
+
+        assert len([s for s in statements if s.startswith("INSERT")]) == 1
+        assert all(embedding.id is not None for embedding in embeddings)
+        await _assert_stored(session_scope, embeddings)
+
+    asyncio.run(scenario())
+
+
+def test_batch_rolls_back_on_error(session_scope: SessionScope) -> None:
+    async def scenario() -> None:
+        image_ids = await _add_images(session_scope)
+        async with session_scope() as session:
+            writer = WalnutImageEmbeddingDBWriter(session)
+            with pytest.raises(RuntimeError):
+                async with writer.batch():
+                    for embedding in _embeddings(image_ids):
+                        await writer.save_async(embedding)
+                    raise RuntimeError("abort the batch")
+
+            # The writer is usable again after the failed batch
+            await writer.save_async(_embeddings(image_ids[:1])[0])
+            await session.commit()
+            assert await count_rows(session, WalnutImageEmbeddingDBDAO.__tablename__) == 1
+
+    asyncio.run(scenario())